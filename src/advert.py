@@ -2,6 +2,9 @@ import sqlite3
 from bs4 import BeautifulSoup
 from typing import Dict, Any, Optional, List, Type, Union, TypeVar, Iterator
 
+# Marks a field that has not been extracted from the HTML yet
+_NOT_PARSED: Any = object()
+
 
 class Advertisement:
     """Base class for job advertisements."""
@@ -24,6 +27,7 @@ class Advertisement:
         self.status: Optional[int] = status
         # Parse HTML only once and store the BeautifulSoup object
         self.soup: BeautifulSoup = BeautifulSoup(self.source, "html.parser")
+        self._description: Optional[str] = _NOT_PARSED
 
     def get_title(self) -> Optional[str]:
         """
@@ -56,6 +60,21 @@ class Advertisement:
         """
         Extract the job description from the advertisement.
 
+        The description is extracted once and reused. Extraction rearranges
+        the parsed HTML, so running it a second time would not give the same
+        text back.
+
+        Returns:
+            Job description or None if not found
+        """
+        if self._description is _NOT_PARSED:
+            self._description = self._parse_description()
+        return self._description
+
+    def _parse_description(self) -> Optional[str]:
+        """
+        Extract the job description from the parsed HTML.
+
         Returns:
             Job description or None if not found
         """
@@ -225,7 +244,7 @@ class KarriereAdvertisement(Advertisement):
         location_element = self.soup.select_one(".m-keyfactBox__jobLocations")
         return location_element.text.strip() if location_element else None
 
-    def get_description(self) -> Optional[str]:
+    def _parse_description(self) -> Optional[str]:
         """
         Extract the job description from a karriere.at advertisement.
         Preserves paragraphs, line breaks, and lists in the output text.
@@ -322,7 +341,7 @@ class StepstoneAdvertisement(Advertisement):
         location_element = self.soup.find("a", {"data-at": "metadata-location"})
         return location_element.text.strip() if location_element else None
 
-    def get_description(self) -> Optional[str]:
+    def _parse_description(self) -> Optional[str]:
         """
         Extract the job description from a stepstone.at advertisement.
         Preserves paragraphs, line breaks, and lists in the output text.
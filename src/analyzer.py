@@ -3,10 +3,9 @@ import yaml
 import logging
 import os
 from typing import Dict, Any, List, Optional, Tuple, Pattern
-import re
 
 from advert import AdFactory, Advertisement
-from keyword_manager import KeywordManager
+from keyword_manager import KeywordManager, KeywordMatcher
 
 
 class AdvertAnalyzer:
@@ -23,7 +22,7 @@ class AdvertAnalyzer:
         self.db_path: str = db_path
         self.config_path: Optional[str] = config_path
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self.compiled_keywords: Dict[int, re.Pattern] = {}
+        self.compiled_keywords: Dict[int, KeywordMatcher] = {}
         self._connection: Optional[sqlite3.Connection] = None
         self.keyword_manager = KeywordManager(self.logger)
 
@@ -134,12 +133,12 @@ class AdvertAnalyzer:
             (keyword["title"], keyword["search"], keyword["case_sensitive"]),
         )
 
-    def _compile_keyword_patterns(self) -> Dict[int, re.Pattern]:
+    def _compile_keyword_patterns(self) -> Dict[int, KeywordMatcher]:
         """
         Fetch and compile keywords from the database.
 
         Returns:
-            Dictionary mapping keyword IDs to compiled regex patterns
+            Dictionary mapping keyword IDs to compiled keyword matchers
         """
         connection = self._get_connection()
         # Use KeywordManager to fetch and compile keywords
@@ -5,12 +5,11 @@ import yaml
 import argparse
 import os
 import logging
-from typing import Dict, List, Any
-import re
+from typing import Dict, List, Any, Optional
 
 from advert import AdFactory, Advertisement
 from harvester import Harvester, HarvesterFactory
-from keyword_manager import KeywordManager
+from keyword_manager import KeywordManager, KeywordMatcher
 from advert_exporter import AdvertExporter
 
 
@@ -54,9 +53,8 @@ def harvest_command(args: argparse.Namespace, logger: logging.Logger) -> None:
         keyword_manager = KeywordManager(logger)
 
         # Insert keywords using KeywordManager instead of Harvester
-        for keyword in config["keywords"]:
-            keyword_manager.insert_keyword(connection, keyword)
-            logger.debug("Added keyword: %s", keyword)
+        keyword_manager.insert_keywords(connection, config["keywords"])
+        logger.debug("Added %d keywords", len(config["keywords"]))
 
         harvester_factory = HarvesterFactory(config)
         logger.debug("Initialized harvester factory")
@@ -380,6 +378,9 @@ def process_advertisements_with_factory(
 
     logger.info("Using %d keywords for matching", len(regexes))
 
+    # One manager for the whole run, so the keyword matcher is built only once
+    keyword_manager = KeywordManager(logger)
+
     # Use the new AdFactory fetch_by_condition method to get advertisements in batches
     advertisements_iterator = AdFactory.fetch_by_condition(
         db_path=db_path, batch_size=batch_size
@@ -388,7 +389,9 @@ def process_advertisements_with_factory(
     # Process each advertisement
     for ad in advertisements_iterator:
         # Match keywords for this advertisement
-        matched_keyword_ids = match_keywords_for_ad(ad, regexes, logger)
+        matched_keyword_ids = match_keywords_for_ad(
+            ad, regexes, logger, keyword_manager
+        )
 
         # Update keyword matches in the database
         update_advertisement_keywords(connection, ad.id, matched_keyword_ids, logger)
@@ -406,21 +409,27 @@ def process_advertisements_with_factory(
 
 
 def match_keywords_for_ad(
-    ad: Advertisement, regexes: Dict[int, re.Pattern], logger: logging.Logger
+    ad: Advertisement,
+    regexes: Dict[int, KeywordMatcher],
+    logger: logging.Logger,
+    keyword_manager: Optional[KeywordManager] = None,
 ) -> List[int]:
     """
     Match an advertisement against keywords and return matching keyword IDs.
 
     Args:
         ad: Advertisement instance to check
-        regexes: Dictionary of compiled regex patterns for keywords
+        regexes: Dictionary mapping keyword IDs to compiled keyword matchers
         logger: Logger instance
+        keyword_manager: KeywordManager to reuse across advertisements;
+                         a new one is created if not provided
 
     Returns:
         List of keyword IDs that match the advertisement
     """
     # Use KeywordManager directly for matching keywords
-    keyword_manager = KeywordManager(logger)
+    if keyword_manager is None:
+        keyword_manager = KeywordManager(logger)
     return keyword_manager.match_keywords(ad, regexes)
 
 
@@ -4,15 +4,27 @@ from urllib.parse import urlparse
 import requests
 import logging
 from abc import abstractmethod
-from time import sleep, time
+from time import monotonic, sleep, time
 from datetime import datetime
 from protego import Protego
-from typing import Dict, List, Any, Iterator, Optional, Type, Tuple, Pattern
+from typing import (
+    Dict,
+    List,
+    Any,
+    Iterator,
+    Mapping,
+    Optional,
+    Type,
+    Tuple,
+    Pattern,
+    TextIO,
+)
 import os
 import yaml
 import csv
 import io
 from pathlib import Path
+from types import MappingProxyType
 import re
 import xml.etree.ElementTree as ET
 
@@ -22,22 +34,57 @@ from advert import (
     KarriereAdvertisement,
     StepstoneAdvertisement,
 )
-from keyword_manager import KeywordManager
+from keyword_manager import KeywordManager, KeywordMatcher
 
 
 class Harvester:
     AGENT = "Crawler"
     _url: Optional[str] = None
-    _headers: Dict[str, str] = {
-        "User-Agent": AGENT,
-        "Connection": "keep-alive",
-        "accept": "accept: text/html,application/xhtml+xml,application/xml;q=0.9",
-    }
+    # Shared by every harvester, so it is read-only; override per instance
+    _headers: Mapping[str, str] = MappingProxyType(
+        {
+            "User-Agent": AGENT,
+            "Connection": "keep-alive",
+            "accept": "accept: text/html,application/xhtml+xml,application/xml;q=0.9",
+        }
+    )
     _cookies: Optional[requests.cookies.RequestsCookieJar] = None
     _referer: Optional[str] = None
-    _last_request: float = time()
+    # Monotonic timestamp of the last request, immune to wall clock changes
+    _last_request: float = monotonic()
     _robot_parser: Optional[Protego] = None
 
+    # Column headers of the CSV export
+    CSV_FIELDNAMES: List[str] = [
+        "job_title",
+        "company_name",
+        "location",
+        "harvest_date",
+        "url",
+        "portal",
+        "related_keywords",
+        "filename",
+    ]
+
+    # Advertisements table with the updated schema and its indexes
+    SCHEMA_SQL = """
+        CREATE TABLE IF NOT EXISTS advertisements (
+            id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+            title TEXT,
+            description TEXT,
+            company TEXT,
+            location TEXT,
+            url TEXT NOT NULL UNIQUE,
+            html_body TEXT NOT NULL,
+            http_status INTEGER NOT NULL,
+            ad_type TEXT NOT NULL,
+            filename TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE INDEX IF NOT EXISTS idx_advertisements_url ON advertisements(url);
+        CREATE INDEX IF NOT EXISTS idx_advertisements_ad_type ON advertisements(ad_type);
+    """
+
     def __init__(self, config: Dict[str, Any]) -> None:
         self.url: str = config["url"]
         self.requests_per_minute: int = config.get("requests_per_minute", 1)
@@ -45,6 +92,9 @@ class Harvester:
         self.retry_timeout: int = config.get("retry_timeout", 5)
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.keyword_manager = KeywordManager(self.logger)
+        # One session per harvester keeps connections to the portal alive
+        # between requests instead of a new TCP/TLS handshake per page
+        self._session = requests.Session()
 
     @staticmethod
     def create_schema(connection: sqlite3.Connection) -> None:
@@ -52,44 +102,17 @@ class Harvester:
         Create the database schema if it doesn't exist.
 
         This method creates the tables needed for storing advertisements.
-        Keyword-related tables are created by the KeywordManager class.
+        Keyword-related table definitions come from the KeywordManager class.
+
+        The DDL runs through executescript(), which first commits any
+        transaction still open on the connection, so changes the caller has
+        not committed yet are committed as well.
 
         Args:
             connection: SQLite database connection
         """
-        cursor = connection.cursor()
-
-        # Create advertisements table with the updated schema
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS advertisements (
-                id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
-                title TEXT,
-                description TEXT,
-                company TEXT,
-                location TEXT,
-                url TEXT NOT NULL UNIQUE,
-                html_body TEXT NOT NULL,
-                http_status INTEGER NOT NULL,
-                ad_type TEXT NOT NULL,
-                filename TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """
-        )
-
-        # Create indexes for better performance
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_advertisements_url ON advertisements(url)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_advertisements_ad_type ON advertisements(ad_type)"
-        )
-
-        # Create keyword-related tables using KeywordManager
-        keyword_manager = KeywordManager()
-        keyword_manager.create_keyword_tables(connection)
-
+        # Run all DDL as one script so SQLite parses it in a single pass
+        connection.executescript(Harvester.SCHEMA_SQL + KeywordManager.SCHEMA_SQL)
         connection.commit()
 
     @staticmethod
@@ -108,7 +131,7 @@ class Harvester:
         keyword_manager.insert_keyword(connection, keyword)
 
     @staticmethod
-    def fetch_keywords(connection: sqlite3.Connection) -> Dict[int, re.Pattern]:
+    def fetch_keywords(connection: sqlite3.Connection) -> Dict[int, KeywordMatcher]:
         """
         Fetch and compile keywords from the database.
 
@@ -119,7 +142,7 @@ class Harvester:
             connection: SQLite database connection
 
         Returns:
-            Dictionary mapping keyword IDs to compiled regex patterns
+            Dictionary mapping keyword IDs to compiled keyword matchers
         """
         keyword_manager = KeywordManager()
         return keyword_manager.fetch_keywords(connection)
@@ -353,6 +376,8 @@ class Harvester:
         except Exception as e:
             self.logger.error("Critical error in harvest process: %s", str(e))
             errors += 1
+        finally:
+            self._session.close()
 
         # Log summary
         elapsed_time = time() - start_time
@@ -366,7 +391,7 @@ class Harvester:
         )
 
     def match_keywords(
-        self, advert: Advertisement, regexes: Dict[int, re.Pattern]
+        self, advert: Advertisement, regexes: Dict[int, KeywordMatcher]
     ) -> List[int]:
         """
         Matches the advertisement against the keywords.
@@ -376,7 +401,7 @@ class Harvester:
 
         Args:
             advert: Advertisement to match against keywords
-            regexes: Dictionary mapping keyword IDs to compiled regex patterns
+            regexes: Dictionary mapping keyword IDs to compiled keyword matchers
 
         Returns:
             List of keyword IDs that match the advertisement
@@ -405,7 +430,7 @@ class Harvester:
     def _get_robot_parser(self, refresh: bool = False) -> Protego:
         if not self._robot_parser or refresh:
             self._robot_parser = Protego.parse(
-                requests.get(f"{self.url}/robots.txt", headers=self._headers).text
+                self._session.get(f"{self.url}/robots.txt", headers=self._headers).text
             )
         return self._robot_parser
 
@@ -426,17 +451,17 @@ class Harvester:
         return self._get_robot_parser().can_fetch(uri, self.AGENT)
 
     def _get(self, *args: Any, **kwargs: Any) -> requests.Response:
-        now = time()
+        now = monotonic()
         if self._last_request + self.crawl_delay > now:
             delay = self._last_request + self.crawl_delay - now
             self.logger.debug("Respecting crawl delay, waiting %.2f seconds", delay)
             sleep(delay)
-        self._last_request = time()
+        self._last_request = monotonic()
         self.logger.debug(
             "Sending GET request to %s",
             args[0] if args else kwargs.get("url", "unknown"),
         )
-        response = requests.get(*args, **kwargs)
+        response = self._session.get(*args, **kwargs)
         if response.cookies:
             self._cookies = response.cookies
         return response
@@ -581,18 +606,6 @@ class Harvester:
             connection, min_id, max_id
         )
 
-        # Define CSV headers
-        fieldnames = [
-            "job_title",
-            "company_name",
-            "location",
-            "harvest_date",
-            "url",
-            "portal",
-            "related_keywords",
-            "filename",
-        ]
-
         logger.info(
             "Exporting %d advertisements to CSV file: %s",
             len(advertisements),
@@ -602,22 +615,7 @@ class Harvester:
         # Write to CSV
         try:
             with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for ad in advertisements:
-                    writer.writerow(
-                        {
-                            "job_title": ad["title"],
-                            "company_name": ad["company"],
-                            "location": ad["location"],
-                            "harvest_date": ad["date"],
-                            "url": ad["url"],
-                            "portal": ad["portal"],
-                            "related_keywords": "; ".join(ad["keywords"]),
-                            "filename": ad["filename"] or "",
-                        }
-                    )
+                Harvester._write_csv_rows(csvfile, advertisements)
                 logger.info("CSV export completed successfully")
         except IOError as e:
             logger.error("Failed to write CSV file: %s", e)
@@ -651,21 +649,26 @@ class Harvester:
 
         logger.info("Generating CSV string for %d advertisements", len(advertisements))
 
-        # Define CSV headers
-        fieldnames = [
-            "job_title",
-            "company_name",
-            "location",
-            "harvest_date",
-            "url",
-            "portal",
-            "related_keywords",
-            "filename",
-        ]
-
         # Write to CSV string
         output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
+        Harvester._write_csv_rows(output, advertisements)
+
+        logger.debug(
+            "CSV string generation completed with %d rows", len(advertisements)
+        )
+        return output.getvalue()
+
+    @staticmethod
+    def _write_csv_rows(csvfile: TextIO, advertisements: List[Dict[str, Any]]) -> None:
+        """
+        Write the CSV header and one row per advertisement to a text stream.
+
+        Args:
+            csvfile: Text stream to write to
+            advertisements: Advertisements as returned by
+                fetch_advertisements_by_id_range
+        """
+        writer = csv.DictWriter(csvfile, fieldnames=Harvester.CSV_FIELDNAMES)
         writer.writeheader()
 
         for ad in advertisements:
@@ -682,11 +685,6 @@ class Harvester:
                 }
             )
 
-        logger.debug(
-            "CSV string generation completed with %d rows", len(advertisements)
-        )
-        return output.getvalue()
-
     @staticmethod
     def export_html_bodies(
         connection: sqlite3.Connection,
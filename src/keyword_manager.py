@@ -1,10 +1,81 @@
 import re
 import logging
 import sqlite3
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Any,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from advert import Advertisement
 
+# Number of compiled keyword matchers kept across fetch_keywords calls
+COMPILE_CACHE_SIZE = 256
+
+
+class LiteralMatcher:
+    """
+    Matches a keyword that contains no regex metacharacters.
+
+    Plain substring search with str.find avoids the regex engine setup
+    entirely. The object mirrors the parts of the re.Pattern interface
+    used by the keyword code (pattern, flags and search).
+
+    str.lower() only agrees with re.IGNORECASE on ASCII, so case insensitive
+    searches involving other characters (e.g. "İ" or "ſ") go through the
+    regex engine. _compile_keyword only builds case insensitive literal
+    matchers for ASCII keywords.
+    """
+
+    __slots__ = ("pattern", "case_sensitive", "_needle", "_regex")
+
+    def __init__(self, pattern: str, case_sensitive: bool) -> None:
+        """
+        Initialize the LiteralMatcher.
+
+        Args:
+            pattern: Literal search string
+            case_sensitive: Whether the search is case sensitive
+        """
+        self.pattern: str = pattern
+        self.case_sensitive: bool = case_sensitive
+        self._needle: str = pattern if case_sensitive else pattern.lower()
+        self._regex: Optional[re.Pattern] = (
+            None if case_sensitive else re.compile(re.escape(pattern), re.IGNORECASE)
+        )
+
+    @property
+    def flags(self) -> int:
+        """Regex flags equivalent to this matcher's case sensitivity."""
+        if self.case_sensitive:
+            return re.UNICODE
+        return re.UNICODE | re.IGNORECASE
+
+    def search(self, text: str) -> bool:
+        """
+        Check whether the literal occurs in the given text.
+
+        Args:
+            text: Text to search in
+
+        Returns:
+            True if the literal was found, False otherwise
+        """
+        if self.case_sensitive:
+            return text.find(self._needle) >= 0
+        if text.isascii() and self._needle.isascii():
+            return text.lower().find(self._needle) >= 0
+        return self._regex.search(text) is not None
+
+
+KeywordMatcher = Union[re.Pattern, LiteralMatcher]
+
 
 class KeywordManager:
     """
@@ -12,6 +83,23 @@ class KeywordManager:
     against keywords stored in the database.
     """
 
+    # Keyword tables and the many-to-many relationship table
+    SCHEMA_SQL = """
+        CREATE TABLE IF NOT EXISTS keywords (
+            id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+            title TEXT,
+            search TEXT NOT NULL UNIQUE,
+            case_sensitive BOOLEAN NOT NULL DEFAULT 0 CHECK (case_sensitive IN (0, 1))
+        );
+        CREATE TABLE IF NOT EXISTS keyword_advertisement (
+            keyword_id INTEGER,
+            advertisement_id INTEGER,
+            FOREIGN KEY (keyword_id) REFERENCES keywords(id),
+            FOREIGN KEY (advertisement_id) REFERENCES advertisements(id),
+            PRIMARY KEY (keyword_id, advertisement_id)
+        );
+    """
+
     def __init__(self, logger: Optional[logging.Logger] = None) -> None:
         """
         Initialize the KeywordManager.
@@ -22,41 +110,20 @@ class KeywordManager:
         self.logger = logger or logging.getLogger(
             f"{__name__}.{self.__class__.__name__}"
         )
+        self._matcher_keywords: Tuple[Tuple[int, KeywordMatcher], ...] = ()
+        self._matcher: Optional[Callable[[str], List[int]]] = None
 
     def create_keyword_tables(self, connection: sqlite3.Connection) -> None:
         """
         Create the database tables for keywords if they don't exist.
 
+        The DDL runs through executescript(), which first commits any
+        transaction still open on the connection.
+
         Args:
             connection: SQLite database connection
         """
-        cursor = connection.cursor()
-
-        # Create keywords table
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS keywords (
-                id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
-                title TEXT,
-                search TEXT NOT NULL UNIQUE,
-                case_sensitive BOOLEAN NOT NULL DEFAULT 0 CHECK (case_sensitive IN (0, 1))
-            )
-            """
-        )
-
-        # Create many-to-many relationship table
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS keyword_advertisement (
-                keyword_id INTEGER,
-                advertisement_id INTEGER,
-                FOREIGN KEY (keyword_id) REFERENCES keywords(id),
-                FOREIGN KEY (advertisement_id) REFERENCES advertisements(id),
-                PRIMARY KEY (keyword_id, advertisement_id)
-            )
-            """
-        )
-
+        connection.executescript(self.SCHEMA_SQL)
         connection.commit()
 
     def insert_keyword(
@@ -69,14 +136,34 @@ class KeywordManager:
             connection: SQLite database connection
             keyword: Dictionary containing keyword data (title, search, case_sensitive)
         """
+        self.insert_keywords(connection, [keyword])
+
+    def insert_keywords(
+        self, connection: sqlite3.Connection, keywords: Iterable[Dict[str, Any]]
+    ) -> None:
+        """
+        Insert several keywords in a single statement and transaction.
+
+        Keywords that already exist in the database are ignored.
+
+        Args:
+            connection: SQLite database connection
+            keywords: Dictionaries containing keyword data
+                      (title, search, case_sensitive)
+        """
         cursor = connection.cursor()
-        cursor.execute(
+        cursor.executemany(
             "INSERT OR IGNORE INTO keywords (title, search, case_sensitive) VALUES (?, ?, ?)",
-            (keyword["title"], keyword["search"], keyword["case_sensitive"]),
+            (
+                (keyword["title"], keyword["search"], keyword["case_sensitive"])
+                for keyword in keywords
+            ),
         )
         connection.commit()
 
-    def fetch_keywords(self, connection: sqlite3.Connection) -> Dict[int, re.Pattern]:
+    def fetch_keywords(
+        self, connection: sqlite3.Connection
+    ) -> Dict[int, KeywordMatcher]:
         """
         Fetch and compile keywords from the database.
 
@@ -84,14 +171,14 @@ class KeywordManager:
             connection: SQLite database connection
 
         Returns:
-            Dictionary mapping keyword IDs to compiled regex patterns
+            Dictionary mapping keyword IDs to compiled keyword matchers
         """
         cursor = connection.cursor()
         cursor.execute("SELECT id, search, case_sensitive FROM keywords")
         result = cursor.fetchall()
 
         if result:
-            self.logger.debug(f"Fetched {len(result)} keywords from database")
+            self.logger.debug("Fetched %d keywords from database", len(result))
             return dict(
                 [
                     (
@@ -106,17 +193,27 @@ class KeywordManager:
         return {}
 
     @staticmethod
-    def _compile_keyword(search: str, case_sensitive: bool) -> re.Pattern:
+    @lru_cache(maxsize=COMPILE_CACHE_SIZE)
+    def _compile_keyword(search: str, case_sensitive: bool) -> KeywordMatcher:
         """
-        Compiles a keyword into a regex pattern.
+        Compiles a keyword into a matcher.
+
+        Keywords without any regex metacharacters are matched with a plain
+        substring search instead of the regex engine, as long as they are
+        case sensitive or ASCII only. Results are cached per
+        (search, case_sensitive) pair, so recompiling the same keywords after
+        a reload returns the existing matchers.
 
         Args:
             search: Search pattern string
             case_sensitive: Whether the pattern is case sensitive
 
         Returns:
-            Compiled regular expression pattern
+            LiteralMatcher for literal keywords, compiled regular expression
+            pattern otherwise
         """
+        if re.escape(search) == search and (case_sensitive or search.isascii()):
+            return LiteralMatcher(search, bool(case_sensitive))
         if case_sensitive:
             return re.compile(search)
         return re.compile(search, re.IGNORECASE)
@@ -124,7 +221,7 @@ class KeywordManager:
     def match_keywords(
         self,
         advert: Advertisement,
-        regexes: Dict[int, re.Pattern],
+        regexes: Dict[int, KeywordMatcher],
         title_only: bool = True,
     ) -> List[int]:
         """
@@ -135,7 +232,7 @@ class KeywordManager:
 
         Args:
             advert: Advertisement to match against keywords
-            regexes: Dictionary mapping keyword IDs to compiled regex patterns
+            regexes: Dictionary mapping keyword IDs to compiled keyword matchers
             title_only: If True, only match against the job title. If False, match against
                         description or fall back to raw HTML source if needed.
 
@@ -184,14 +281,56 @@ class KeywordManager:
             return result
 
         # Search for each keyword in the search text
-        for keyword_id, regex in regexes.items():
-            if regex.search(search_text):
-                # If the keyword matches, add it to the result
-                result.append(keyword_id)
+        result = self._get_matcher(regexes)(search_text)
 
-        self.logger.debug(f"Found {len(result)} keyword matches in {search_field}")
+        self.logger.debug("Found %d keyword matches in %s", len(result), search_field)
         return result
 
+    @staticmethod
+    def build_matcher(
+        regexes: Dict[int, KeywordMatcher],
+    ) -> Callable[[str], List[int]]:
+        """
+        Build a function matching a text against a fixed set of keywords.
+
+        The keyword set does not change while a harvest or analysis runs,
+        so the search methods are bound once up front instead of being
+        looked up through the dictionary for every advertisement.
+
+        Args:
+            regexes: Dictionary mapping keyword IDs to compiled keyword matchers
+
+        Returns:
+            Function returning the IDs of the keywords found in a text
+        """
+        searches = [(keyword_id, regex.search) for keyword_id, regex in regexes.items()]
+
+        def match(text: str) -> List[int]:
+            return [keyword_id for keyword_id, search in searches if search(text)]
+
+        return match
+
+    def _get_matcher(
+        self, regexes: Dict[int, KeywordMatcher]
+    ) -> Callable[[str], List[int]]:
+        """
+        Return the matcher for the given keywords, rebuilding it on change.
+
+        The keyword IDs and matchers are compared by content, so a dictionary
+        that was modified in place still gets a fresh matcher.
+
+        Args:
+            regexes: Dictionary mapping keyword IDs to compiled keyword matchers
+
+        Returns:
+            Function returning the IDs of the keywords found in a text
+        """
+        keywords = tuple(regexes.items())
+        if self._matcher is None or keywords != self._matcher_keywords:
+            self._matcher = self.build_matcher(regexes)
+            self._matcher_keywords = keywords
+        return self._matcher
+
     def store_keyword_matches(
         self,
         connection: sqlite3.Connection,
@@ -208,19 +347,20 @@ class KeywordManager:
         """
         if not matched_keywords:
             self.logger.debug(
-                f"No keyword matches to store for advertisement {advertisement_id}"
+                "No keyword matches to store for advertisement %s", advertisement_id
             )
             return
 
         cursor = connection.cursor()
         try:
-            for keyword_id in matched_keywords:
-                cursor.execute(
-                    "INSERT INTO keyword_advertisement (keyword_id, advertisement_id) VALUES (?, ?)",
-                    (keyword_id, advertisement_id),
-                )
+            cursor.executemany(
+                "INSERT INTO keyword_advertisement (keyword_id, advertisement_id) VALUES (?, ?)",
+                ((keyword_id, advertisement_id) for keyword_id in matched_keywords),
+            )
             self.logger.debug(
-                f"Stored {len(matched_keywords)} keyword matches for advertisement {advertisement_id}"
+                "Stored %d keyword matches for advertisement %s",
+                len(matched_keywords),
+                advertisement_id,
             )
         except sqlite3.Error as e:
             self.logger.error(f"Error storing keyword matches: {e}")
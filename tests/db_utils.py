@@ -0,0 +1,17 @@
+"""Shared helpers for the SQLite databases used by the tests."""
+
+import os
+import sqlite3
+from typing import Optional
+
+# Keep test databases in RAM-backed storage when the platform offers it
+TEST_DB_DIR: Optional[str] = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+
+def connect_test_db(db_path: str) -> sqlite3.Connection:
+    """Open a test database without journal files or fsync calls."""
+    connection = sqlite3.connect(db_path)
+    connection.execute("PRAGMA journal_mode=MEMORY")
+    connection.execute("PRAGMA synchronous=OFF")
+    connection.execute("PRAGMA temp_store=MEMORY")
+    return connection
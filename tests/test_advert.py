@@ -239,6 +239,12 @@ class TestStepstoneAdvertisement(unittest.TestCase):
         self.assertIn("We are seeking a Python developer", description)
         self.assertIn("Skills required: Python, Django, SQL", description)
 
+    def test_get_description_repeated(self) -> None:
+        """Test that get_description returns the same text on every call."""
+        description = self.advert.get_description()
+        self.assertEqual(self.advert.get_description(), description)
+        self.assertEqual(self.advert.to_dict()["description"], description)
+
     def test_get_date(self) -> None:
         """Test that get_date extracts the posting date correctly."""
         date = self.advert.get_date()
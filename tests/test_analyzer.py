@@ -1,4 +1,6 @@
 import unittest
+import contextlib
+import gc
 import os
 import sys
 import sqlite3
@@ -6,7 +8,8 @@ import tempfile
 import re
 import shutil
 import yaml
-from unittest.mock import patch, MagicMock, PropertyMock, mock_open
+from types import SimpleNamespace
+from unittest.mock import ANY, patch, Mock, MagicMock, PropertyMock, mock_open
 from typing import Dict, Any, List, Optional, Tuple
 from time import sleep
 
@@ -23,82 +26,103 @@ logging.basicConfig(
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from analyzer import AdvertAnalyzer
+from keyword_manager import LiteralMatcher
 from advert import (
     Advertisement,
     AdFactory,
     StepstoneAdvertisement,
     KarriereAdvertisement,
 )
+from db_utils import TEST_DB_DIR, connect_test_db
 
 
-class TestAdvertAnalyzer(unittest.TestCase):
-    """Test cases for AdvertAnalyzer class."""
+# Only Windows keeps file locks around after a connection is closed
+UNLINK_ATTEMPTS = 10 if sys.platform == "win32" else 1
 
-    def setUp(self) -> None:
-        """Set up test environment with a temporary database."""
-        # Create a temporary database file
-        self.temp_db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
-        os.close(self.temp_db_fd)
 
-        # Create a temporary config file
-        self.config_content = {
-            "keywords": [
-                {"title": "Python", "search": "python", "case_sensitive": False},
-                {"title": "Java", "search": "\\bjava\\b", "case_sensitive": False},
-                {"title": "SQL", "search": "SQL", "case_sensitive": True},
-            ]
-        }
-        self.config_fd, self.config_path = tempfile.mkstemp(suffix=".yml")
-        with os.fdopen(self.config_fd, "w") as f:
-            yaml.dump(self.config_content, f)
+def _unlink_with_retry(path: str, attempts: int = UNLINK_ATTEMPTS) -> None:
+    """Delete a file, retrying briefly while another handle still holds it."""
+    for _ in range(attempts - 1):
+        with contextlib.suppress(PermissionError):
+            if os.path.exists(path):
+                os.unlink(path)
+            return
+        sleep(0.01)
+    # Last attempt lets the PermissionError surface
+    if os.path.exists(path):
+        os.unlink(path)
 
-        # Create the database schema
-        self.connection = sqlite3.connect(self.db_path)
-        self._create_test_schema()
 
-        # Set up the analyzer instance
-        self.analyzer = AdvertAnalyzer(
-            db_path=self.db_path, config_path=self.config_path
-        )
+def _ad(title: str, desc: str, source: str) -> SimpleNamespace:
+    """Build a lightweight advertisement stub for keyword matching."""
+    return SimpleNamespace(
+        source=source,
+        get_title=lambda t=title: t,
+        get_description=lambda d=desc: d,
+    )
 
+
+class AnalyzerTestCase(unittest.TestCase):
+    """Shared fixtures for the AdvertAnalyzer test cases."""
+
+    config_content: Dict[str, Any] = {
+        "keywords": [
+            {"title": "Python", "search": "python", "case_sensitive": False},
+            {"title": "Java", "search": "\\bjava\\b", "case_sensitive": False},
+            {"title": "SQL", "search": "SQL", "case_sensitive": True},
+        ]
+    }
+    # The config file is never parsed; yaml.safe_load is patched to return
+    # config_content directly
+    config_path: str = os.devnull
+
+    @classmethod
+    def _patch_config(cls) -> Any:
+        """Return a patcher that serves config_content without parsing YAML."""
+        return patch("analyzer.yaml.safe_load", return_value=cls.config_content)
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build a template database and compile the keywords once."""
         # Register advertisement classes with AdFactory
         AdFactory.register(KarriereAdvertisement.__name__, KarriereAdvertisement)
         AdFactory.register(StepstoneAdvertisement.__name__, StepstoneAdvertisement)
 
-        # Insert test data
-        self._insert_test_data()
-
-    def tearDown(self) -> None:
-        """Clean up test environment."""
-        # Ensure analyzer connection is closed
-        if hasattr(self, "analyzer"):
-            self.analyzer._close_connection()
-
-        # Close the test connection if it exists
-        if hasattr(self, "connection") and self.connection:
-            self.connection.close()
-
-        # Add a short delay to ensure connections are fully released
-        # (especially important on Windows)
-        sleep(0.1)
-
-        # Now delete the temporary files
-        if os.path.exists(self.db_path):
-            try:
-                os.unlink(self.db_path)
-            except PermissionError:
-                # On Windows, sometimes we need a bit more time for file locks to be released
-                logging.warning(
-                    "Failed to delete temporary database on first attempt, retrying..."
-                )
-                sleep(0.5)
-                os.unlink(self.db_path)
-
-        os.unlink(self.config_path)
-
-    def _create_test_schema(self) -> None:
+        template_fd, cls._template_path = tempfile.mkstemp(
+            suffix=".db", dir=TEST_DB_DIR
+        )
+        os.close(template_fd)
+
+        connection = connect_test_db(cls._template_path)
+        try:
+            cls._create_test_schema(connection)
+            cls._insert_test_data(connection)
+        finally:
+            connection.close()
+
+        # Compile the configured keywords once against a scratch copy so the
+        # template itself stays free of keyword rows
+        scratch_fd, scratch_path = tempfile.mkstemp(suffix=".db", dir=TEST_DB_DIR)
+        os.close(scratch_fd)
+        try:
+            shutil.copyfile(cls._template_path, scratch_path)
+            analyzer = AdvertAnalyzer(db_path=scratch_path, config_path=cls.config_path)
+            with cls._patch_config():
+                analyzer.load_keywords_from_config()
+            cls._compiled_keywords = analyzer._compile_keyword_patterns()
+            analyzer._close_connection()
+        finally:
+            os.unlink(scratch_path)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the template database."""
+        os.unlink(cls._template_path)
+
+    @staticmethod
+    def _create_test_schema(connection: sqlite3.Connection) -> None:
         """Create a test database schema."""
-        cursor = self.connection.cursor()
+        cursor = connection.cursor()
 
         # Create advertisements table
         cursor.execute(
@@ -144,70 +168,72 @@ class TestAdvertAnalyzer(unittest.TestCase):
             """
         )
 
-        self.connection.commit()
+        connection.commit()
 
-    def _insert_test_data(self) -> None:
+    @staticmethod
+    def _insert_test_data(connection: sqlite3.Connection) -> None:
         """Insert test data into the database."""
-        cursor = self.connection.cursor()
-
-        # Insert test advertisements
+        # Test advertisements in the column order of the INSERT below
         test_ads = [
-            {
-                "title": "Python Developer",
-                "description": "We are looking for a Python developer with Django experience.",
-                "company": "Tech Company",
-                "location": "Berlin",
-                "url": "https://example.com/python-job",
-                "html_body": "<html><body><h1>Python Developer</h1><p>Looking for Python skills</p></body></html>",
-                "http_status": 200,
-                "ad_type": "StepstoneAdvertisement",
-                "filename": None,
-            },
-            {
-                "title": "Java Engineer",
-                "description": "Java backend engineer needed for enterprise applications.",
-                "company": "Enterprise Corp",
-                "location": "Vienna",
-                "url": "https://example.com/java-job",
-                "html_body": "<html><body><h1>Java Engineer</h1><p>Java and SQL required</p></body></html>",
-                "http_status": 200,
-                "ad_type": "KarriereAdvertisement",
-                "filename": None,
-            },
-            {
-                "title": "Full Stack Developer",
-                "description": "Full stack developer for web applications using JavaScript.",
-                "company": "Web Solutions",
-                "location": "Remote",
-                "url": "https://example.com/fullstack-job",
-                "html_body": "<html><body><h1>Full Stack Developer</h1><p>JavaScript, HTML, CSS</p></body></html>",
-                "http_status": 200,
-                "ad_type": "StepstoneAdvertisement",
-                "filename": None,
-            },
+            (
+                "Python Developer",
+                "We are looking for a Python developer with Django experience.",
+                "Tech Company",
+                "Berlin",
+                "https://example.com/python-job",
+                "<html><body><h1>Python Developer</h1><p>Looking for Python skills</p></body></html>",
+                200,
+                "StepstoneAdvertisement",
+                None,
+            ),
+            (
+                "Java Engineer",
+                "Java backend engineer needed for enterprise applications.",
+                "Enterprise Corp",
+                "Vienna",
+                "https://example.com/java-job",
+                "<html><body><h1>Java Engineer</h1><p>Java and SQL required</p></body></html>",
+                200,
+                "KarriereAdvertisement",
+                None,
+            ),
+            (
+                "Full Stack Developer",
+                "Full stack developer for web applications using JavaScript.",
+                "Web Solutions",
+                "Remote",
+                "https://example.com/fullstack-job",
+                "<html><body><h1>Full Stack Developer</h1><p>JavaScript, HTML, CSS</p></body></html>",
+                200,
+                "StepstoneAdvertisement",
+                None,
+            ),
         ]
 
-        for ad in test_ads:
-            cursor.execute(
+        with connection:
+            connection.executemany(
                 """
                 INSERT INTO advertisements 
                 (title, description, company, location, url, html_body, http_status, ad_type, filename) 
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    ad["title"],
-                    ad["description"],
-                    ad["company"],
-                    ad["location"],
-                    ad["url"],
-                    ad["html_body"],
-                    ad["http_status"],
-                    ad["ad_type"],
-                    ad["filename"],
-                ),
+                test_ads,
             )
 
-        self.connection.commit()
+
+class TestAdvertAnalyzerReadOnly(AnalyzerTestCase):
+    """Test cases for AdvertAnalyzer that never write to the database."""
+
+    def setUp(self) -> None:
+        """Set up an analyzer on the shared template database."""
+        self.db_path = self._template_path
+        self.analyzer = AdvertAnalyzer(
+            db_path=self.db_path, config_path=self.config_path
+        )
+
+    def tearDown(self) -> None:
+        """Close the analyzer connection."""
+        self.analyzer._close_connection()
 
     def test_initialization(self) -> None:
         """Test the initialization of AdvertAnalyzer."""
@@ -245,8 +271,143 @@ class TestAdvertAnalyzer(unittest.TestCase):
         # Closing when no connection exists should not raise an error
         self.analyzer._close_connection()
 
+    def test_match_keywords_for_ad(self) -> None:
+        """Test matching keywords for an advertisement."""
+        # Reuse the keyword patterns compiled once for the class
+        self.analyzer.compiled_keywords = dict(self._compiled_keywords)
+
+        # Create a test advertisement with title and description
+        ad = _ad(
+            "Python and Java Developer",
+            "Developer with SQL knowledge",
+            "<html><body>Python and Java developer with SQL knowledge</body></html>",
+        )
+
+        # Match keywords using title only (default)
+        matched_ids = self.analyzer.match_keywords_for_ad(ad)
+        
+        # Verify Python and Java keywords matched in title
+        self.assertEqual(len(matched_ids), 2)
+        
+        # Now match with include_description=True which should also find SQL
+        matched_ids = self.analyzer.match_keywords_for_ad(ad, include_description=True)
+        
+        # Verify all three keywords matched
+        self.assertEqual(len(matched_ids), 3)
+
+        # Try another advertisement with no matches in title but one in description
+        ad = _ad(
+            "JavaScript Developer",
+            "Knowledge of Python required",
+            "<html><body>JavaScript developer with Python knowledge</body></html>",
+        )
+
+        # With title only, shouldn't match any keywords
+        matched_ids = self.analyzer.match_keywords_for_ad(ad)
+        self.assertEqual(len(matched_ids), 0)
+        
+        # With description included, should match Python
+        matched_ids = self.analyzer.match_keywords_for_ad(ad, include_description=True)
+        self.assertEqual(len(matched_ids), 1)
+
+        # Test with a description that contains only SQL in lowercase
+        ad = _ad(
+            "Database Developer",
+            "sql developer",
+            "<html><body>sql developer</body></html>",
+        )
+
+        # SQL is case-sensitive, so shouldn't match with lowercase
+        matched_ids = self.analyzer.match_keywords_for_ad(ad, include_description=True)
+        self.assertEqual(len(matched_ids), 0)
+
+    @patch("advert.AdFactory.fetch_by_condition")
+    def test_process_advertisements_with_id_range(self, mock_fetch: MagicMock) -> None:
+        """Test processing advertisements with ID range filters."""
+        # Setup the mock to return an empty list so the method executes fully
+        mock_fetch.return_value = []
+
+        # Make sure the analyzer has compiled keywords to avoid early returns
+        self.analyzer.compiled_keywords = {1: re.compile("test")}
+
+        # Process with min_id
+        self.analyzer.process_advertisements(min_id=2)
+
+        # Verify fetch_by_condition was called with the correct condition
+        mock_fetch.assert_called_once_with(
+            condition="id >= ?", params=[2], batch_size=100, connection=ANY
+        )
+
+        # Reset mock and test with max_id
+        mock_fetch.reset_mock()
+        self.analyzer.process_advertisements(max_id=5)
+
+        # Verify fetch_by_condition was called with the correct condition
+        mock_fetch.assert_called_once_with(
+            condition="id <= ?", params=[5], batch_size=100, connection=ANY
+        )
+
+        # Reset mock and test with both min_id and max_id
+        mock_fetch.reset_mock()
+        self.analyzer.process_advertisements(min_id=2, max_id=5)
+
+        # Verify fetch_by_condition was called with the correct condition
+        mock_fetch.assert_called_once_with(
+            condition="id >= ? AND id <= ?",
+            params=[2, 5],
+            batch_size=100,
+            connection=ANY,
+        )
+
+
+class TestAdvertAnalyzerMutating(AnalyzerTestCase):
+    """Test cases for AdvertAnalyzer that modify their own database copy."""
+
+    def setUp(self) -> None:
+        """Set up test environment with a copy of the template database."""
+        # Create a temporary database file from the template
+        self.temp_db_fd, self.db_path = tempfile.mkstemp(suffix=".db", dir=TEST_DB_DIR)
+        os.close(self.temp_db_fd)
+        shutil.copyfile(self._template_path, self.db_path)
+
+        self.connection = connect_test_db(self.db_path)
+
+        # Serve the keyword config without a YAML round-trip
+        self._config_patcher = self._patch_config()
+        self._config_patcher.start()
+        self.addCleanup(self._config_patcher.stop)
+
+        # Set up the analyzer instance
+        self.analyzer = AdvertAnalyzer(
+            db_path=self.db_path, config_path=self.config_path
+        )
+
+    def tearDown(self) -> None:
+        """Clean up test environment."""
+        # Ensure analyzer connection is closed
+        if hasattr(self, "analyzer"):
+            self.analyzer._close_connection()
+
+        # Close the test connection if it exists
+        if hasattr(self, "connection") and self.connection:
+            self.connection.close()
+
+        # Drop any lingering references to the connections before unlinking
+        gc.collect()
+
+        for path in (self.db_path, self.db_path + "-shm", self.db_path + "-wal"):
+            _unlink_with_retry(path)
+
     def test_load_keywords_from_config(self) -> None:
-        """Test loading keywords from configuration."""
+        """Test loading keywords from a real YAML configuration file."""
+        # This test covers the YAML parsing itself, so use the real parser
+        self._config_patcher.stop()
+        config_fd, config_path = tempfile.mkstemp(suffix=".yml")
+        with os.fdopen(config_fd, "w") as f:
+            yaml.dump(self.config_content, f)
+        self.addCleanup(os.unlink, config_path)
+        self.analyzer.config_path = config_path
+
         # Reset keyword tables to ensure clean state
         self.analyzer.reset_keyword_tables()
 
@@ -314,7 +475,7 @@ class TestAdvertAnalyzer(unittest.TestCase):
 
         # Check the types of compiled patterns
         for keyword_id, pattern in patterns.items():
-            self.assertIsInstance(pattern, re.Pattern)
+            self.assertIsInstance(pattern, (re.Pattern, LiteralMatcher))
 
         # Test a pattern match
         cursor = self.connection.cursor()
@@ -337,24 +498,23 @@ class TestAdvertAnalyzer(unittest.TestCase):
     def test_process_advertisements(self, mock_fetch: MagicMock) -> None:
         """Test processing advertisements."""
         # Set up mock advertisements
-        ad1 = MagicMock(spec=Advertisement)
+        ad1 = Mock(spec=Advertisement)
         ad1.id = 1
         ad1.source = "<html><body>Python developer</body></html>"
-        ad1.get_title = MagicMock(return_value="Python Developer")
-        ad1.get_description = MagicMock(return_value="Python developer position")
+        ad1.get_title.return_value = "Python Developer"
+        ad1.get_description.return_value = "Python developer position"
 
-        ad2 = MagicMock(spec=Advertisement)
+        ad2 = Mock(spec=Advertisement)
         ad2.id = 2
         ad2.source = "<html><body>Java and SQL developer</body></html>"
-        ad2.get_title = MagicMock(return_value="Java Developer")
-        ad2.get_description = MagicMock(return_value="Java and SQL developer position")
+        ad2.get_title.return_value = "Java Developer"
+        ad2.get_description.return_value = "Java and SQL developer position"
 
         # Set up the mock to return our test advertisements
         mock_fetch.return_value = [ad1, ad2]
 
-        # Load keywords and compile patterns
-        self.analyzer.load_keywords_from_config()
-        self.analyzer._compile_keyword_patterns()
+        # Reuse the keyword patterns compiled once for the class
+        self.analyzer.compiled_keywords = dict(self._compiled_keywords)
 
         # Process advertisements with default settings (title_only matching)
         count = self.analyzer.process_advertisements()
@@ -390,172 +550,52 @@ class TestAdvertAnalyzer(unittest.TestCase):
         ad2.get_title.assert_called()
         ad2.get_description.assert_called()
 
-    def test_match_keywords_for_ad(self) -> None:
-        """Test matching keywords for an advertisement."""
-        # Load keywords and compile patterns
-        self.analyzer.load_keywords_from_config()
-        self.analyzer._compile_keyword_patterns()
-
-        # Create a test advertisement with proper mocking for title and description
-        ad = MagicMock(spec=Advertisement)
-        ad.source = "<html><body>Python and Java developer with SQL knowledge</body></html>"
-        ad.get_title = MagicMock(return_value="Python and Java Developer")
-        ad.get_description = MagicMock(return_value="Developer with SQL knowledge")
-
-        # Match keywords using title only (default)
-        matched_ids = self.analyzer.match_keywords_for_ad(ad)
-        
-        # Verify Python and Java keywords matched in title
-        self.assertEqual(len(matched_ids), 2)
-        
-        # Now match with include_description=True which should also find SQL
-        matched_ids = self.analyzer.match_keywords_for_ad(ad, include_description=True)
-        
-        # Verify all three keywords matched
-        self.assertEqual(len(matched_ids), 3)
-
-        # Try another advertisement with no matches in title but one in description
-        ad.get_title = MagicMock(return_value="JavaScript Developer")
-        ad.get_description = MagicMock(return_value="Knowledge of Python required")
-        ad.source = "<html><body>JavaScript developer with Python knowledge</body></html>"
-
-        # With title only, shouldn't match any keywords
-        matched_ids = self.analyzer.match_keywords_for_ad(ad)
-        self.assertEqual(len(matched_ids), 0)
-        
-        # With description included, should match Python
-        matched_ids = self.analyzer.match_keywords_for_ad(ad, include_description=True)
-        self.assertEqual(len(matched_ids), 1)
-
-        # Test with a description that contains only SQL in lowercase
-        ad.get_title = MagicMock(return_value="Database Developer")
-        ad.get_description = MagicMock(return_value="sql developer")
-        ad.source = "<html><body>sql developer</body></html>"
-
-        # SQL is case-sensitive, so shouldn't match with lowercase
-        matched_ids = self.analyzer.match_keywords_for_ad(ad, include_description=True)
-        self.assertEqual(len(matched_ids), 0)
-
     def test_update_advertisement_keywords(self) -> None:
         """Test updating advertisement keywords associations."""
         # Insert some test keywords
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "INSERT INTO keywords (title, search, case_sensitive) VALUES (?, ?, ?)",
-            ("Python", "python", 0),
-        )
-        python_id = cursor.lastrowid
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO keywords (title, search, case_sensitive) VALUES (?, ?, ?)",
+                [("Python", "python", 0), ("Java", "java", 0)],
+            )
 
-        cursor.execute(
-            "INSERT INTO keywords (title, search, case_sensitive) VALUES (?, ?, ?)",
-            ("Java", "java", 0),
+        keyword_ids = dict(
+            self.connection.execute(
+                "SELECT title, id FROM keywords WHERE title IN ('Python', 'Java')"
+            ).fetchall()
         )
-        java_id = cursor.lastrowid
-
-        self.connection.commit()
+        python_id = keyword_ids["Python"]
+        java_id = keyword_ids["Java"]
 
         # Get the test advertisement ID
-        cursor.execute("SELECT id FROM advertisements LIMIT 1")
-        ad_id = cursor.fetchone()[0]
+        ad_id = self.connection.execute(
+            "SELECT id FROM advertisements LIMIT 1"
+        ).fetchone()[0]
 
         # Test with initial keywords
         self.analyzer.update_advertisement_keywords(ad_id, [python_id])
-
-        # Commit the changes explicitly to ensure they're visible in the next query
-        self.connection.commit()
-
-        cursor.execute(
-            "SELECT keyword_id FROM keyword_advertisement WHERE advertisement_id = ?",
-            (ad_id,),
-        )
-        keyword_ids = [row[0] for row in cursor.fetchall()]
-        self.assertEqual(
-            len(keyword_ids),
-            1,
-            f"Expected 1 keyword, found {len(keyword_ids)} for ad_id={ad_id}, python_id={python_id}",
-        )
-        self.assertIn(python_id, keyword_ids)
+        self._assert_keyword_ids(ad_id, [python_id])
 
         # Update with a different set of keywords
         self.analyzer.update_advertisement_keywords(ad_id, [java_id])
-
-        # Commit again
-        self.connection.commit()
-
-        cursor.execute(
-            "SELECT keyword_id FROM keyword_advertisement WHERE advertisement_id = ?",
-            (ad_id,),
-        )
-        keyword_ids = [row[0] for row in cursor.fetchall()]
-        self.assertEqual(len(keyword_ids), 1)
-        self.assertIn(java_id, keyword_ids)
-        self.assertNotIn(python_id, keyword_ids)
+        self._assert_keyword_ids(ad_id, [java_id])
 
         # Update with multiple keywords
         self.analyzer.update_advertisement_keywords(ad_id, [python_id, java_id])
-
-        # Commit again
-        self.connection.commit()
-
-        cursor.execute(
-            "SELECT keyword_id FROM keyword_advertisement WHERE advertisement_id = ?",
-            (ad_id,),
-        )
-        keyword_ids = [row[0] for row in cursor.fetchall()]
-        self.assertEqual(len(keyword_ids), 2)
-        self.assertIn(python_id, keyword_ids)
-        self.assertIn(java_id, keyword_ids)
+        self._assert_keyword_ids(ad_id, [python_id, java_id])
 
         # Update with empty list should clear associations
         self.analyzer.update_advertisement_keywords(ad_id, [])
+        self._assert_keyword_ids(ad_id, [])
 
-        # Commit again
-        self.connection.commit()
-
-        cursor.execute(
-            "SELECT COUNT(*) FROM keyword_advertisement WHERE advertisement_id = ?",
+    def _assert_keyword_ids(self, ad_id: int, expected: List[int]) -> None:
+        """Assert the keyword IDs currently associated with an advertisement."""
+        rows = self.connection.execute(
+            "SELECT keyword_id FROM keyword_advertisement "
+            "WHERE advertisement_id = ? ORDER BY keyword_id",
             (ad_id,),
-        )
-        count = cursor.fetchone()[0]
-        self.assertEqual(count, 0)
-
-    @patch("advert.AdFactory.fetch_by_condition")
-    def test_process_advertisements_with_id_range(self, mock_fetch: MagicMock) -> None:
-        """Test processing advertisements with ID range filters."""
-        # Setup the mock to return an empty list so the method executes fully
-        mock_fetch.return_value = []
-
-        # Make sure the analyzer has compiled keywords to avoid early returns
-        self.analyzer.compiled_keywords = {1: re.compile("test")}
-
-        # Process with min_id
-        self.analyzer.process_advertisements(min_id=2)
-
-        # Verify fetch_by_condition was called with the correct condition
-        mock_fetch.assert_called_once()
-        call_kwargs = mock_fetch.call_args.kwargs
-        self.assertEqual(call_kwargs["condition"], "id >= ?")
-        self.assertEqual(call_kwargs["params"], [2])
-
-        # Reset mock and test with max_id
-        mock_fetch.reset_mock()
-        self.analyzer.process_advertisements(max_id=5)
-
-        # Verify fetch_by_condition was called with the correct condition
-        mock_fetch.assert_called_once()
-        call_kwargs = mock_fetch.call_args.kwargs
-        self.assertEqual(call_kwargs["condition"], "id <= ?")
-        self.assertEqual(call_kwargs["params"], [5])
-
-        # Reset mock and test with both min_id and max_id
-        mock_fetch.reset_mock()
-        self.analyzer.process_advertisements(min_id=2, max_id=5)
-
-        # Verify fetch_by_condition was called with the correct condition
-        mock_fetch.assert_called_once()
-        call_kwargs = mock_fetch.call_args.kwargs
-        self.assertEqual(call_kwargs["condition"], "id >= ? AND id <= ?")
-        self.assertEqual(call_kwargs["params"], [2, 5])
+        ).fetchall()
+        self.assertEqual([row[0] for row in rows], sorted(expected))
 
     @patch("analyzer.AdvertAnalyzer.process_advertisements")
     def test_run_analysis(self, mock_process: MagicMock) -> None:
@@ -1,10 +1,12 @@
 import unittest
+import argparse
 import os
 import sys
 import logging
 import tempfile
 import sqlite3
-from unittest.mock import patch, MagicMock, mock_open
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
 from typing import Dict, Any, List
 
 # Configure logging at DEBUG level
@@ -20,6 +22,18 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 import crawler
 from harvester import Harvester, HarvesterFactory
 
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# Parsed arguments for the harvest command, shared by the main() tests
+HARVEST_ARGS = argparse.Namespace(
+    command="harvest", config="config.yml", database="test.db", loglevel="INFO"
+)
+
+
+def _harvest_args(**overrides: Any) -> argparse.Namespace:
+    """Return a copy of HARVEST_ARGS with the given attributes replaced."""
+    return argparse.Namespace(**{**vars(HARVEST_ARGS), **overrides})
+
 
 class TestSetupLogging(unittest.TestCase):
     """Test cases for the setup_logging function."""
@@ -28,11 +42,14 @@ class TestSetupLogging(unittest.TestCase):
     def test_valid_log_level(self, mock_basic_config: MagicMock) -> None:
         """Test setup_logging with valid log level."""
         # Test with valid log levels
-        for level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            crawler.setup_logging(level)
-            mock_basic_config.assert_called()
-            # Reset mock for next iteration
-            mock_basic_config.reset_mock()
+        for level in LOG_LEVELS:
+            with self.subTest(level=level):
+                crawler.setup_logging(level)
+                self.assertEqual(
+                    mock_basic_config.call_args.kwargs["level"],
+                    getattr(logging, level),
+                )
+        self.assertEqual(mock_basic_config.call_count, len(LOG_LEVELS))
 
     def test_invalid_log_level(self) -> None:
         """Test setup_logging with invalid log level."""
@@ -46,33 +63,33 @@ class TestMainFunction(unittest.TestCase):
     @patch("argparse.ArgumentParser.parse_args")
     @patch("crawler.setup_logging")
     @patch("logging.getLogger")
+    @patch("crawler.HarvesterFactory")
+    @patch("crawler.Harvester")
+    @patch("sqlite3.connect")
+    @patch("yaml.safe_load", return_value={"keywords": []})
+    @patch("crawler.open", create=True)
     def test_argument_parsing(
         self,
+        mock_file: MagicMock,
+        mock_safe_load: MagicMock,
+        mock_connect: MagicMock,
+        mock_harvester: MagicMock,
+        mock_factory: MagicMock,
         mock_get_logger: MagicMock,
         mock_setup_logging: MagicMock,
         mock_parse_args: MagicMock,
     ) -> None:
         """Test command line argument parsing."""
-        # Setup mock args
-        mock_args = MagicMock()
-        mock_args.command = "harvest"
-        mock_args.config = "config.yml"
-        mock_args.database = "test.db"
-        mock_args.loglevel = "INFO"
+        # Setup parsed args
+        mock_args = _harvest_args()
         mock_parse_args.return_value = mock_args
 
         # Setup mock logger
         mock_logger = MagicMock()
         mock_get_logger.return_value = mock_logger
 
-        # Mock the rest of the function to isolate argument parsing test
-        with patch("builtins.open", mock_open(read_data="keywords: []")):
-            with patch("yaml.safe_load", return_value={"keywords": []}):
-                with patch("sqlite3.connect"):
-                    with patch("crawler.Harvester"):
-                        with patch("crawler.HarvesterFactory"):
-                            # Call the main function
-                            crawler.main()
+        # Call the main function; the rest is patched by the decorators
+        crawler.main()
 
         # Verify setup_logging was called with the right log level
         mock_setup_logging.assert_called_once_with(mock_args.loglevel)
@@ -87,12 +104,8 @@ class TestMainFunction(unittest.TestCase):
         mock_parse_args: MagicMock,
     ) -> None:
         """Test handling of FileNotFoundError."""
-        # Setup mock args
-        mock_args = MagicMock()
-        mock_args.command = "harvest"  # Add the command attribute
-        mock_args.config = "nonexistent.yml"
-        mock_args.database = "test.db"
-        mock_args.loglevel = "INFO"
+        # Setup parsed args
+        mock_args = _harvest_args(config="nonexistent.yml")
         mock_parse_args.return_value = mock_args
 
         # Setup mock logger
@@ -112,64 +125,68 @@ class TestMainFunction(unittest.TestCase):
 class TestThreadManagement(unittest.TestCase):
     """Test cases for thread management."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the mock harvesters once for the whole class."""
+        # No spec=Harvester: renaming __class__ on a spec'd mock would rename
+        # the real Harvester class, and url is only set in __init__
+        cls._mock_harvesters = [MagicMock(), MagicMock()]
+        for index, mock_harvester in enumerate(cls._mock_harvesters, start=1):
+            mock_harvester.__class__.__name__ = f"MockHarvester{index}"
+
+    def setUp(self) -> None:
+        """Clear calls recorded on the shared mock harvesters."""
+        for mock_harvester in self._mock_harvesters:
+            mock_harvester.reset_mock()
+
     @patch("argparse.ArgumentParser.parse_args")
     @patch("crawler.setup_logging")
     @patch("logging.getLogger")
     @patch("threading.Thread")
+    @patch("crawler.HarvesterFactory")
+    @patch("sqlite3.connect")
+    @patch(
+        "yaml.safe_load",
+        return_value={
+            "keywords": [],
+            "portals": [
+                {"engine": "MockHarvester1"},
+                {"engine": "MockHarvester2"},
+            ],
+        },
+    )
+    @patch("crawler.open", create=True)
     def test_thread_creation_and_execution(
         self,
+        mock_file: MagicMock,
+        mock_safe_load: MagicMock,
+        mock_connect: MagicMock,
+        mock_factory: MagicMock,
         mock_thread: MagicMock,
         mock_get_logger: MagicMock,
         mock_setup_logging: MagicMock,
         mock_parse_args: MagicMock,
     ) -> None:
         """Test creation and management of threads."""
-        # Setup mock args
-        mock_args = MagicMock()
-        mock_args.command = "harvest"
-        mock_args.config = "config.yml"
-        mock_args.database = "test.db"
-        mock_args.loglevel = "INFO"
+        # Setup parsed args
+        mock_args = _harvest_args()
         mock_parse_args.return_value = mock_args
 
         # Setup mock logger
         mock_logger = MagicMock()
         mock_get_logger.return_value = mock_logger
 
-        # Create mock harvesters
-        mock_harvester1 = MagicMock()
-        mock_harvester1.__class__.__name__ = "MockHarvester1"
-        mock_harvester2 = MagicMock()
-        mock_harvester2.__class__.__name__ = "MockHarvester2"
-
         # Mock thread instances
         mock_thread_instance = MagicMock()
         mock_thread.return_value = mock_thread_instance
 
-        # Mock configuration and connections
-        with patch("builtins.open", mock_open()):
-            with patch(
-                "yaml.safe_load",
-                return_value={
-                    "keywords": [],
-                    "portals": [
-                        {"engine": "MockHarvester1"},
-                        {"engine": "MockHarvester2"},
-                    ],
-                },
-            ):
-                with patch("sqlite3.connect"):
-                    with patch.object(crawler, "HarvesterFactory") as mock_factory:
-                        # Setup mock harvester factory to return our mock harvesters
-                        mock_factory_instance = MagicMock()
-                        mock_factory.return_value = mock_factory_instance
-                        mock_factory_instance.get_next_harvester.return_value = [
-                            mock_harvester1,
-                            mock_harvester2,
-                        ]
-
-                        # Run the main function
-                        crawler.main()
+        # Setup mock harvester factory to return our mock harvesters
+        mock_factory_instance = MagicMock()
+        mock_factory.return_value = mock_factory_instance
+        mock_factory_instance.get_next_harvester.return_value = self._mock_harvesters
+
+        # Run the main function
+        crawler.main()
 
         # Verify threads were created and started
         self.assertEqual(
@@ -193,20 +210,15 @@ class TestDatabaseOperations(unittest.TestCase):
     """Test cases for database operations."""
 
     def setUp(self) -> None:
-        """Set up test environment with a temporary database."""
-        # Create a temporary database file
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False)
-        self.db_path = self.temp_db.name
-        self.temp_db.close()
-
-        # Create connection and schema
-        self.connection = sqlite3.connect(self.db_path)
+        """Set up test environment with an in-memory database."""
+        # Create connection and schema; autocommit so tests control
+        # transactions explicitly
+        self.connection = sqlite3.connect(":memory:", isolation_level=None)
         Harvester.create_schema(self.connection)
 
     def tearDown(self) -> None:
         """Clean up test environment."""
         self.connection.close()
-        os.unlink(self.db_path)
 
     def test_database_schema(self) -> None:
         """Test that the database schema is created correctly."""
@@ -238,7 +250,8 @@ class TestDatabaseOperations(unittest.TestCase):
         """Test exporting advertisements to CSV."""
         cursor = self.connection.cursor()
 
-        # Insert test data
+        # Insert test data in one explicit transaction
+        cursor.execute("BEGIN")
         cursor.execute(
             """
             INSERT INTO advertisements 
@@ -270,23 +283,21 @@ class TestDatabaseOperations(unittest.TestCase):
             "INSERT INTO keyword_advertisement (keyword_id, advertisement_id) VALUES (?, ?)",
             (keyword_id, ad_id),
         )
-
-        self.connection.commit()
+        cursor.execute("COMMIT")
 
         # Create a mock for AdFactory.create to return our test data
         with patch("advert.AdFactory.create") as mock_factory_create:
             # Create a mock advertisement that returns our test values
-            mock_ad = MagicMock()
-            mock_ad.get_title.return_value = "Test Job"
-            mock_ad.get_company.return_value = "Test Company"
-            mock_ad.get_location.return_value = "Test Location"
+            mock_ad = SimpleNamespace(
+                get_title=lambda: "Test Job",
+                get_company=lambda: "Test Company",
+                get_location=lambda: "Test Location",
+            )
             mock_factory_create.return_value = mock_ad
 
             # Test CSV export
-            with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as temp_csv:
-                csv_path = temp_csv.name
-
-            try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                csv_path = os.path.join(temp_dir, "export.csv")
                 record_count = Harvester.export_to_csv(self.connection, csv_path)
                 self.assertEqual(record_count, 1)
 
@@ -298,8 +309,6 @@ class TestDatabaseOperations(unittest.TestCase):
                     self.assertIn("Test Location", content)
                     self.assertIn("test_file.html", content)  # New filename field
                     self.assertIn("Python", content)  # Check related keywords
-            finally:
-                os.unlink(csv_path)
 
 
 if __name__ == "__main__":
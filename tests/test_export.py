@@ -1,11 +1,13 @@
 import unittest
 import os
 import sys
+import shutil
 import tempfile
 import sqlite3
 import yaml
 import logging
 from pathlib import Path
+from typing import Dict
 
 # Configure logging at DEBUG level
 logging.basicConfig(
@@ -23,20 +25,21 @@ from harvester import Harvester
 class TestHtmlExport(unittest.TestCase):
     """Test cases for the HTML export functionality."""
 
-    def setUp(self) -> None:
-        """Set up test environment with a temporary database."""
-        # Create a temporary database file
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-        self.db_path = self.temp_db.name
-        self.temp_db.close()
-
-        # Create a temporary directory for output
-        self.temp_output_dir = tempfile.mkdtemp()
-
+    # Expected export path of each fixture advertisement, relative to the
+    # output directory
+    REL_PATHS: Dict[int, str] = {
+        1: os.path.join("higher_education", "full_time", "karriere_00001.html"),
+        2: os.path.join("vocational", "part_time", "stepstone_00002.html"),
+        3: os.path.join("other_education", "other_job_type", "indeed_00003.html"),
+    }
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up the config file and an in-memory database once."""
         # Create a temporary config file
-        self.temp_config = tempfile.NamedTemporaryFile(delete=False, suffix=".yml")
-        self.config_path = self.temp_config.name
-        self.temp_config.close()  # Explicitly close the file
+        temp_config = tempfile.NamedTemporaryFile(delete=False, suffix=".yml")
+        cls.config_path = temp_config.name
+        temp_config.close()  # Explicitly close the file
 
         # Write test configuration to the file
         test_config = {
@@ -66,31 +69,16 @@ class TestHtmlExport(unittest.TestCase):
             }
         }
 
-        with open(self.config_path, "w", encoding="utf-8") as f:
+        with open(cls.config_path, "w", encoding="utf-8") as f:
             yaml.dump(test_config, f)
 
         # Create connection and schema
-        self.connection = sqlite3.connect(self.db_path)
-        Harvester.create_schema(self.connection)
+        cls.connection = sqlite3.connect(":memory:")
+        Harvester.create_schema(cls.connection)
 
         # Insert test data
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            INSERT INTO keywords (title, search, case_sensitive)
-            VALUES (?, ?, ?)
-            """,
-            ("Job title", r"pattern", False),
-        )
-        keyword_id = cursor.lastrowid
-
-        # Higher education + Full-time advertisement
-        cursor.execute(
-            """
-            INSERT INTO advertisements 
-            (title, html_body, http_status, url, ad_type) 
-            VALUES (?, ?, ?, ?, ?)
-            """,
+        ads = [
+            # Higher education + Full-time advertisement
             (
                 "University Professor",
                 "<html><body><h1>University Professor</h1><p>We seek a full-time professor.</p></body></html>",
@@ -98,24 +86,7 @@ class TestHtmlExport(unittest.TestCase):
                 "https://karriere.at/jobs/1",
                 "KarriereAdvertisement",
             ),
-        )
-
-        last_id = cursor.lastrowid
-        cursor.execute(
-            """
-            INSERT INTO keyword_advertisement (keyword_id, advertisement_id) 
-            VALUES (?, ?)
-            """,
-            (keyword_id, last_id),
-        )
-
-        # Vocational + Part-time advertisement
-        cursor.execute(
-            """
-            INSERT INTO advertisements 
-            (title, html_body, http_status, url, ad_type) 
-            VALUES (?, ?, ?, ?, ?)
-            """,
+            # Vocational + Part-time advertisement
             (
                 "Apprentice Developer",
                 "<html><body><h1>Apprentice Developer</h1><p>Part-time position for vocational training.</p></body></html>",
@@ -123,24 +94,7 @@ class TestHtmlExport(unittest.TestCase):
                 "https://stepstone.at/jobs/2",
                 "StepstoneAdvertisement",
             ),
-        )
-
-        last_id = cursor.lastrowid
-        cursor.execute(
-            """
-            INSERT INTO keyword_advertisement (keyword_id, advertisement_id) 
-            VALUES (?, ?)
-            """,
-            (keyword_id, last_id),
-        )
-
-        # Other education + Other job type advertisement
-        cursor.execute(
-            """
-            INSERT INTO advertisements 
-            (title, html_body, http_status, url, ad_type) 
-            VALUES (?, ?, ?, ?, ?)
-            """,
+            # Other education + Other job type advertisement
             (
                 "Cook",
                 "<html><body><h1>Cook</h1><p>Experienced cook needed.</p></body></html>",
@@ -148,32 +102,61 @@ class TestHtmlExport(unittest.TestCase):
                 "https://indeed.com/jobs/3",
                 "IndeedAdvertisement",
             ),
-        )
+        ]
+
+        with cls.connection:
+            cursor = cls.connection.cursor()
+            cursor.execute(
+                """
+                INSERT INTO keywords (title, search, case_sensitive)
+                VALUES (?, ?, ?)
+                """,
+                ("Job title", r"pattern", False),
+            )
+            keyword_id = cursor.lastrowid
+
+            cursor.executemany(
+                """
+                INSERT INTO advertisements 
+                (title, html_body, http_status, url, ad_type) 
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                ads,
+            )
+            # The database is fresh, so the advertisements get IDs 1..n
+            cursor.executemany(
+                """
+                INSERT INTO keyword_advertisement (keyword_id, advertisement_id) 
+                VALUES (?, ?)
+                """,
+                [(keyword_id, ad_id) for ad_id in range(1, len(ads) + 1)],
+            )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Close the database and remove the config file."""
+        cls.connection.close()
+        os.unlink(cls.config_path)
 
-        last_id = cursor.lastrowid
-        cursor.execute(
-            """
-            INSERT INTO keyword_advertisement (keyword_id, advertisement_id) 
-            VALUES (?, ?)
-            """,
-            (keyword_id, last_id),
-        )
+    def setUp(self) -> None:
+        """Set up a fresh output directory and clear exported filenames."""
+        # Create a temporary directory for output
+        self.temp_output_dir = tempfile.mkdtemp()
 
-        self.connection.commit()
+        # Undo filename updates made by earlier exports
+        with self.connection:
+            self.connection.execute("UPDATE advertisements SET filename = NULL")
 
     def tearDown(self) -> None:
         """Clean up test environment."""
-        self.connection.close()
-        os.unlink(self.db_path)
-        os.unlink(self.config_path)
-
-        # Remove all files in temp output directory
-        for root, dirs, files in os.walk(self.temp_output_dir, topdown=False):
-            for name in files:
-                os.remove(os.path.join(root, name))
-            for name in dirs:
-                os.rmdir(os.path.join(root, name))
-        os.rmdir(self.temp_output_dir)
+        # Remove the temp output directory with everything exported into it
+        shutil.rmtree(self.temp_output_dir, ignore_errors=True)
+
+    def _read_export(self, ad_id: int) -> str:
+        """Read the exported HTML file of a fixture advertisement."""
+        path = os.path.join(self.temp_output_dir, self.REL_PATHS[ad_id])
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
 
     def test_export_html_bodies(self) -> None:
         """Test export_html_bodies with multi-category filters."""
@@ -185,65 +168,35 @@ class TestHtmlExport(unittest.TestCase):
         self.assertEqual(total_exported, 3)
 
         # Check that category counts are correct
-        self.assertEqual(category_counts["education_level"], 3)
-        self.assertEqual(category_counts["job_type"], 3)
+        self.assertEqual(category_counts, {"education_level": 3, "job_type": 3})
 
         # Check that files were created in the right directories
-        university_file_path = os.path.join(
-            self.temp_output_dir, "higher_education", "full_time", "karriere_00001.html"
-        )
-        apprentice_file_path = os.path.join(
-            self.temp_output_dir, "vocational", "part_time", "stepstone_00002.html"
-        )
-        other_file_path = os.path.join(
-            self.temp_output_dir,
-            "other_education",
-            "other_job_type",
-            "indeed_00003.html",
-        )
-
-        self.assertTrue(os.path.exists(university_file_path))
-        self.assertTrue(os.path.exists(apprentice_file_path))
-        self.assertTrue(os.path.exists(other_file_path))
+        for ad_id, rel_path in self.REL_PATHS.items():
+            with self.subTest(ad_id=ad_id):
+                self.assertTrue(
+                    os.path.exists(os.path.join(self.temp_output_dir, rel_path))
+                )
 
         # Check file content
-        with open(university_file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            self.assertIn("University Professor", content)
-            self.assertIn("full-time professor", content)
+        content = self._read_export(1)
+        self.assertIn("University Professor", content)
+        self.assertIn("full-time professor", content)
 
-        with open(apprentice_file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            self.assertIn("Apprentice Developer", content)
-            self.assertIn("Part-time", content)
-            self.assertIn("vocational training", content)
+        content = self._read_export(2)
+        self.assertIn("Apprentice Developer", content)
+        self.assertIn("Part-time", content)
+        self.assertIn("vocational training", content)
 
-        with open(other_file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            self.assertIn("Cook", content)
+        content = self._read_export(3)
+        self.assertIn("Cook", content)
 
         # Check database was updated with filenames
-        cursor = self.connection.cursor()
-
-        cursor.execute("SELECT filename FROM advertisements WHERE id = 1")
-        result = cursor.fetchone()
-        self.assertEqual(
-            result[0],
-            os.path.join("higher_education", "full_time", "karriere_00001.html"),
-        )
-
-        cursor.execute("SELECT filename FROM advertisements WHERE id = 2")
-        result = cursor.fetchone()
-        self.assertEqual(
-            result[0], os.path.join("vocational", "part_time", "stepstone_00002.html")
-        )
-
-        cursor.execute("SELECT filename FROM advertisements WHERE id = 3")
-        result = cursor.fetchone()
-        self.assertEqual(
-            result[0],
-            os.path.join("other_education", "other_job_type", "indeed_00003.html"),
+        filenames = dict(
+            self.connection.execute(
+                "SELECT id, filename FROM advertisements WHERE id IN (1, 2, 3)"
+            ).fetchall()
         )
+        self.assertEqual(filenames, self.REL_PATHS)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
+import itertools
 import logging
 import sqlite3
 import tempfile
 import unittest
-from unittest.mock import call, patch, MagicMock
+from functools import lru_cache
+from unittest.mock import call, patch
 from time import time, sleep
+from types import SimpleNamespace
 import sys
 import os
 import re
@@ -25,6 +28,8 @@ from harvester import (
     MonsterHarvester,
     StepStoneHarvester,
 )
+from keyword_manager import KeywordManager
+from db_utils import TEST_DB_DIR, connect_test_db
 
 KEYWORDS = [
     {"title": "Manager", "search": r"manager", "case_sensitive": False},
@@ -34,191 +39,153 @@ KEYWORDS = [
 
 logger = logging.getLogger(__name__)
 
+# Schema built once and copied into each test database with backup()
+SCHEMA_TEMPLATE = None
+# Directory holding every file-backed test database, removed in one go at the end
+TEST_DB_TMPDIR = None
+
+
+def setUpModule():
+    global SCHEMA_TEMPLATE, TEST_DB_TMPDIR
+    SCHEMA_TEMPLATE = sqlite3.connect(":memory:")
+    Harvester.create_schema(SCHEMA_TEMPLATE)
+    TEST_DB_TMPDIR = tempfile.TemporaryDirectory(
+        prefix="harvester_test_", dir=TEST_DB_DIR
+    )
+
+
+def tearDownModule():
+    SCHEMA_TEMPLATE.close()
+    TEST_DB_TMPDIR.cleanup()
+
+
+_test_db_ids = itertools.count()
+
+
+def _temp_db_path():
+    return os.path.join(TEST_DB_TMPDIR.name, "%d.db" % next(_test_db_ids))
+
+
+def _connect_with_schema(database):
+    connection = connect_test_db(database)
+    SCHEMA_TEMPLATE.backup(connection)
+    return connection
+
+
+TEST_DATA_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "test_data")
+)
+
+
+def _test_data(name):
+    return os.path.join(TEST_DATA_DIR, name)
+
+
+@lru_cache(maxsize=None)
+def _read_test_data(file_path):
+    # Fixtures are read-only, so each one is read and decoded once per process
+    with open(file_path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+# URL patterns answered by mocked_request_get, in priority order
+URL_ROUTES = [
+    (r"example\.com/robots\.txt$", _test_data("example_robots.txt")),
+    (r"/jobs/manager", _test_data("stepstone.html")),
+    (r"/jobs\?keywords=manager", _test_data("karriere_at.html")),
+    (r"stepstone\.at/robots\.txt$", _test_data("stepstone_robots.txt")),
+    (r"stepstone\.at/sitemap\.xml", _test_data("stepstone_sitemap.xml")),
+    (
+        r"stepstone\.at/.*/sitemaps/.*/listings-[0-9]+\.xml",
+        _test_data("stepstone_listings.xml"),
+    ),
+    (
+        r"stepstone\.at.*/stellenangebote--.*\.html$",
+        _test_data("stepstone_jobs_OTR_Manager.txt.iconv_cleaned_utf8"),
+    ),
+    (r"karriere\.at/robots\.txt$", _test_data("karriere_robots.txt")),
+    (r"karriere\.at/static/sitemaps", _test_data("karriere_sitemap_jobs.xml")),
+    (r"monster\.de/robots\.txt$", _test_data("karriere_robots.txt")),
+    (r"indeed\.com/robots\.txt$", _test_data("karriere_robots.txt")),
+    (r"/jobs/[0-9]+$", _test_data("karriere_job.html")),
+]
+
+# All routes merged into one regex with a named group per route. Each
+# alternative is anchored at the start and scans forward itself, so an
+# earlier route always wins over a later one, as with checking them in order.
+URL_ROUTE_RE = re.compile(
+    "|".join(
+        f"(?:.*?(?P<route{index}>{pattern}))"
+        for index, (pattern, _) in enumerate(URL_ROUTES)
+    ),
+    re.ASCII,
+)
+URL_ROUTE_FILES = {
+    f"route{index}": file_path for index, (_, file_path) in enumerate(URL_ROUTES)
+}
+
+
+class MockResponse:
+    cookies = {"session": "12345"}
+    status_code = 200
+    apparent_encoding = "utf-8"
+
+    def __init__(self, file, status_code, url):
+        self.file = file
+        self.status_code = status_code
+        self.url = url
+
+    @property
+    def text(self):
+        if not self.file:
+            raise ValueError(f"Test data for '{self.url}' does not found!")
+        return _read_test_data(self.file)
+
+    def raise_for_status(self):
+        pass
+
+    def read(self):
+        return self.file.read()
+
 
 def mocked_request_get(*args, **kwargs):
-    class MockResponse:
-        cookies = {"session": "12345"}
-        status_code = 200
-        apparent_encoding = "utf-8"
-
-        def __init__(self, file, status_code):
-            self.file = file
-            self.status_code = status_code
-
-        @property
-        def text(self):
-            if not self.file:
-                raise ValueError(f"Test data for '{args[0]}' does not found!")
-            with open(self.file, "r", encoding="utf-8") as file:
-                return file.read()
-
-        @property
-        def url(self):
-            return args[0]
-
-        def raise_for_status(self):
-            pass
-
-        def read(self):
-            return self.file.read()
-
-    if re.search(r"example.com/robots.txt$", args[0]):
-        return MockResponse(
-            os.path.abspath(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    "test_data",
-                    "example_robots.txt",
-                )
-            ),
-            200,
-        )
-    if re.search(r"/jobs/manager", args[0]):
-        return MockResponse(
-            os.path.abspath(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    "test_data",
-                    "stepstone.html",
-                )
-            ),
-            200,
-        )
-    if re.search(r"/jobs\?keywords=manager", args[0]):
-        return MockResponse(
-            os.path.abspath(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    "test_data",
-                    "karriere_at.html",
-                )
-            ),
-            200,
-        )
-    if re.search(r"stepstone.at/robots.txt$", args[0]):
-        return MockResponse(
-            os.path.abspath(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    "test_data",
-                    "stepstone_robots.txt",
-                ),
-            ),
-            200,
-        )
-    if re.search(r"stepstone.at/sitemap.xml", args[0]):
-        return MockResponse(
-            os.path.abspath(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    "test_data",
-                    "stepstone_sitemap.xml",
-                ),
-            ),
-            200,
-        )
-    if re.search(r"stepstone.at/.*/sitemaps/.*/listings-[0-9]+.xml", args[0]):
-        return MockResponse(
-            os.path.abspath(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    "test_data",
-                    "stepstone_listings.xml",
-                ),
-            ),
-            200,
-        )
-    if re.search(
-        r"stepstone.at.*/stellenangebote--.*\.html$",
-        args[0],
-    ):
-        return MockResponse(
-            os.path.abspath(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    "test_data",
-                    "stepstone_jobs_OTR_Manager.txt.iconv_cleaned_utf8",
-                )
-            ),
-            200,
-        )
-    if re.search(r"karriere.at/robots.txt$", args[0]):
-        return MockResponse(
-            os.path.abspath(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    "test_data",
-                    "karriere_robots.txt",
-                ),
-            ),
-            200,
-        )
-    if re.search(r"karriere.at/static/sitemaps", args[0]):
-        return MockResponse(
-            os.path.abspath(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    "test_data",
-                    "karriere_sitemap_jobs.xml",
-                ),
-            ),
-            200,
-        )
-    if re.search(r"monster.de/robots.txt$", args[0]):
-        return MockResponse(
-            os.path.abspath(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    "test_data",
-                    "karriere_robots.txt",
-                ),
-            ),
-            200,
-        )
-    if re.search(r"indeed.com/robots.txt$", args[0]):
-        return MockResponse(
-            os.path.abspath(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    "test_data",
-                    "karriere_robots.txt",
-                ),
-            ),
-            200,
-        )
-    if re.search(
-        r"/jobs/[0-9]+$",
-        args[0],
-    ):
-        return MockResponse(
-            os.path.abspath(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(__file__)),
-                    "test_data",
-                    "karriere_job.html",
-                )
-            ),
-            200,
-        )
-    return MockResponse(None, 404)
+    match = URL_ROUTE_RE.match(args[0])
+    if match:
+        return MockResponse(URL_ROUTE_FILES[match.lastgroup], 200, args[0])
+    return MockResponse(None, 404, args[0])
 
 
 class TestHarvester(unittest.TestCase):
 
-    @patch("harvester.requests.get", side_effect=mocked_request_get)
-    @patch("harvester.time")
-    @patch("harvester.sleep")
-    def test_get(self, mock_sleep, mock_time, mock_requests_get):
+    @classmethod
+    def setUpClass(cls):
+        # Freeze the rate limiter's clock so no test in this class really sleeps
+        cls.sleep_calls = []
+        cls._patchers = [
+            patch("harvester.monotonic", lambda: 5),
+            patch("harvester.sleep", cls.sleep_calls.append),
+        ]
+        for patcher in cls._patchers:
+            patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        for patcher in cls._patchers:
+            patcher.stop()
+
+    def setUp(self):
+        self.sleep_calls.clear()
+
+    @patch("harvester.requests.Session.get", side_effect=mocked_request_get)
+    def test_get(self, mock_requests_get):
         config = {"url": "http://example.com", "requests_per_minute": 30}
         harvester = Harvester(config)
         harvester._last_request = 0
 
-        mock_time.return_value = 5
-
         response = harvester._get("http://example.com")
 
         self.assertEqual(response.status_code, 404)
-        mock_sleep.assert_called_once()
+        self.assertEqual(len(self.sleep_calls), 1)
         self.assertEqual(harvester._last_request, 5)
         mock_requests_get.assert_has_calls(
             [
@@ -234,7 +201,7 @@ class TestHarvester(unittest.TestCase):
             ]
         )
 
-    @patch("harvester.requests.get", side_effect=mocked_request_get)
+    @patch("harvester.requests.Session.get", side_effect=mocked_request_get)
     def test_cookies(self, mock_requests_get):
         config = {"url": "https://www.stepstone.at", "requests_per_minute": 30}
         harvester = Harvester(config)
@@ -264,41 +231,98 @@ class TestHarvester(unittest.TestCase):
             ]
         )
 
-    @patch("harvester.requests.get", side_effect=mocked_request_get)
+    @patch("harvester.requests.Session.get", side_effect=mocked_request_get)
     def test_robot_uri_check(self, mock_requests_get):
         config = {"url": "https://www.stepstone.at", "requests_per_minute": 60}
         harvester = Harvester(config)
 
+        self.assertTrue(harvester.can_fetch("/jobs/manager"))
+        # The parsed robots.txt is reused for every later check
         self.assertTrue(harvester.can_fetch("/jobs/manager"))
         mock_requests_get.assert_called_once_with(
             "https://www.stepstone.at/robots.txt", headers=harvester._headers
         )
 
 
-class TestStepstoneHarvester(unittest.TestCase):
+class HarvestTestCase(unittest.TestCase):
+    """Shared harvest assertions for the portal specific test cases."""
+
+    def _assert_harvest(self, harvester_class, url, links, advertisements, matches):
+        KeywordManager().insert_keywords(self.connection, KEYWORDS)
+        with patch.object(
+            harvester_class, "get_next_link", return_value=iter(links)
+        ), patch(
+            "harvester.requests.Session.get", side_effect=mocked_request_get
+        ) as mock_requests_get:
+            harvester = harvester_class({"url": url, "requests_per_minute": 6000})
+            harvester._headers = {"User-Agent": Harvester.AGENT}
+
+            with patch.object(harvester._session, "close") as mock_close:
+                harvester.harvest(self.temp_db_file)
+            mock_close.assert_called_once_with()
+
+        headers = {"User-Agent": "Crawler"}
+        mock_requests_get.assert_has_calls(
+            [call(f"{url}/robots.txt", headers=headers), call(url, headers=headers)]
+            + [
+                call(link, headers=headers, cookies={"session": "12345"})
+                for link in links
+            ]
+        )
+        self._assert_row_counts(advertisements, matches)
+
+    def _assert_not_implemented(self, harvester_class, url):
+        KeywordManager().insert_keywords(self.connection, KEYWORDS)
+        with patch(
+            "harvester.requests.Session.get", side_effect=mocked_request_get
+        ) as mock_requests_get:
+            harvester = harvester_class({"url": url, "requests_per_minute": 60})
+            harvester._headers = {"User-Agent": harvester_class.AGENT}
+
+            # Call get_next_link directly, harvest() may handle the exception
+            with self.assertRaises(NotImplementedError) as context:
+                # Force evaluation of the generator
+                list(harvester.get_next_link())
+
+        self.assertEqual(
+            str(context.exception),
+            f"{harvester_class.__name__}.get_next_link() is not implemented yet.",
+        )
+        self.assertFalse(mock_requests_get.called)
+        self._assert_row_counts(0, 0)
+
+    def _assert_row_counts(self, advertisements, matches):
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT count(*) FROM advertisements")
+        self.assertEqual(cursor.fetchone()[0], advertisements)
+        cursor.execute("SELECT count(*) FROM keyword_advertisement")
+        self.assertEqual(cursor.fetchone()[0], matches)
+
+
+class TestStepstoneHarvester(HarvestTestCase):
 
     def setUp(self):
-        self.temp_db_file = tempfile.mkstemp(suffix=".db")[1]
-        self.connection = sqlite3.connect(self.temp_db_file)
+        self.temp_db_file = _temp_db_path()
+        self.connection = _connect_with_schema(self.temp_db_file)
         # self.connection = sqlite3.connect(":memory:")
-        Harvester.create_schema(self.connection)
 
     def tearDown(self):
         # Close the database connection after each test
         self.connection.close()
 
-    @patch("harvester.requests.get", side_effect=mocked_request_get)
+    @patch("harvester.requests.Session.get", side_effect=mocked_request_get)
     def test_get_next_link(self, mock_requests_get):
         config = {"url": "https://www.stepstone.at", "requests_per_minute": 6000}
         harvester = StepStoneHarvester(config)
         harvester._headers = {"User-Agent": "Mozilla/5.0"}
 
-        links = []
+        link_count = 0
         for link in harvester.get_next_link():
-            self.assertIsNotNone(link)
-            links.append(link)
+            if link is None:
+                self.fail("get_next_link() yielded None")
+            link_count += 1
 
-        self.assertEqual(len(links), 11017)
+        self.assertEqual(link_count, 11017)
         mock_requests_get.assert_has_calls(
             [
                 call(
@@ -317,81 +341,44 @@ class TestStepstoneHarvester(unittest.TestCase):
             ]
         )
 
-    @patch("harvester.StepStoneHarvester.get_next_link")
-    @patch("harvester.requests.get", side_effect=mocked_request_get)
-    def test_harwest(self, mock_requests_get, mock_get_next_link):
-        mock_get_next_link.return_value = iter(
+    def test_harwest(self):
+        self._assert_harvest(
+            StepStoneHarvester,
+            "https://www.stepstone.at",
             [
                 "https://www.stepstone.at/stellenangebote--FruehstueckskellnerIn-m-w-d-Bad-Ischl-Alpin-Family-GmbH--888366-inline.html",
                 "https://www.stepstone.at/stellenangebote--Berater-fuer-digitale-Zeitmanagementsysteme-m-w-d-Full-Time-Kufstein-Oesterreich-SELSYS-GmbH--895653-inline.html",
                 "https://www.stepstone.at/stellenangebote--Elektrischer-Instandhaltungstechniker-Oberpullendorf-ISG-Personalmanagement-GmbH--892240-inline.html",
-            ]
-        )
-        config = {"url": "https://www.stepstone.at", "requests_per_minute": 6000}
-        for keyword in KEYWORDS:
-            Harvester.insert_keyword(self.connection, keyword)
-        harvester = StepStoneHarvester(config)
-        harvester._headers = {"User-Agent": Harvester.AGENT}
-
-        harvester.harvest(self.temp_db_file)
-
-        mock_requests_get.assert_has_calls(
-            [
-                call(
-                    "https://www.stepstone.at/robots.txt",
-                    headers={"User-Agent": "Crawler"},
-                ),
-                call("https://www.stepstone.at", headers={"User-Agent": "Crawler"}),
-                call(
-                    "https://www.stepstone.at/stellenangebote--FruehstueckskellnerIn-m-w-d-Bad-Ischl-Alpin-Family-GmbH--888366-inline.html",
-                    headers={"User-Agent": "Crawler"},
-                    cookies={"session": "12345"},
-                ),
-                call(
-                    "https://www.stepstone.at/stellenangebote--Berater-fuer-digitale-Zeitmanagementsysteme-m-w-d-Full-Time-Kufstein-Oesterreich-SELSYS-GmbH--895653-inline.html",
-                    headers={"User-Agent": "Crawler"},
-                    cookies={"session": "12345"},
-                ),
-                call(
-                    "https://www.stepstone.at/stellenangebote--Elektrischer-Instandhaltungstechniker-Oberpullendorf-ISG-Personalmanagement-GmbH--892240-inline.html",
-                    headers={"User-Agent": "Crawler"},
-                    cookies={"session": "12345"},
-                ),
-            ]
+            ],
+            advertisements=3,
+            matches=6,
         )
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT count(*) FROM advertisements")
-        result = cursor.fetchone()
-        self.assertEqual(result[0], 3)
-        cursor.execute("SELECT count(*) FROM keyword_advertisement")
-        result = cursor.fetchone()
-        self.assertEqual(result[0], 6)
 
 
-class TestKarriereAtHarvester(unittest.TestCase):
+class TestKarriereAtHarvester(HarvestTestCase):
 
     def setUp(self):
-        self.temp_db_file = tempfile.mkstemp(suffix=".db")[1]
-        self.connection = sqlite3.connect(self.temp_db_file)
+        self.temp_db_file = _temp_db_path()
+        self.connection = _connect_with_schema(self.temp_db_file)
         # self.connection = sqlite3.connect(":memory:")
-        Harvester.create_schema(self.connection)
 
     def tearDown(self):
         # Close the database connection after each test
         self.connection.close()
 
-    @patch("harvester.requests.get", side_effect=mocked_request_get)
+    @patch("harvester.requests.Session.get", side_effect=mocked_request_get)
     def test_get_next_link(self, mock_requests_get):
         config = {"url": "https://www.karriere.at", "requests_per_minute": 6000}
         harvester = KarriereHarvester(config)
         harvester._headers = {"User-Agent": KarriereHarvester.AGENT}
 
-        links = []
+        link_count = 0
         for link in harvester.get_next_link():
-            self.assertIsNotNone(link)
-            links.append(link)
+            if link is None:
+                self.fail("get_next_link() yielded None")
+            link_count += 1
 
-        self.assertEqual(len(links), 18549)
+        self.assertEqual(link_count, 18549)
         mock_requests_get.assert_has_calls(
             [
                 call(
@@ -405,114 +392,43 @@ class TestKarriereAtHarvester(unittest.TestCase):
             ]
         )
 
-    @patch("harvester.KarriereHarvester.get_next_link")
-    @patch("harvester.requests.get", side_effect=mocked_request_get)
-    def test_harwest(self, mock_requests_get, mock_get_next_link):
-        mock_get_next_link.return_value = iter(
+    def test_harwest(self):
+        self._assert_harvest(
+            KarriereHarvester,
+            "https://www.karriere.at",
             [
                 "https://www.karriere.at/jobs/7473235",
                 "https://www.karriere.at/jobs/7482247",
                 "https://www.karriere.at/jobs/7440898",
-            ]
-        )
-        config = {"url": "https://www.karriere.at", "requests_per_minute": 6000}
-        for keyword in KEYWORDS:
-            Harvester.insert_keyword(self.connection, keyword)
-        harvester = KarriereHarvester(config)
-        harvester._headers = {"User-Agent": KarriereHarvester.AGENT}
-
-        harvester.harvest(self.temp_db_file)
-
-        mock_requests_get.assert_has_calls(
-            [
-                call(
-                    "https://www.karriere.at/robots.txt",
-                    headers={"User-Agent": "Crawler"},
-                ),
-                call("https://www.karriere.at", headers={"User-Agent": "Crawler"}),
-                call(
-                    "https://www.karriere.at/jobs/7473235",
-                    headers={"User-Agent": "Crawler"},
-                    cookies={"session": "12345"},
-                ),
-                call(
-                    "https://www.karriere.at/jobs/7482247",
-                    headers={"User-Agent": "Crawler"},
-                    cookies={"session": "12345"},
-                ),
-                call(
-                    "https://www.karriere.at/jobs/7440898",
-                    headers={"User-Agent": "Crawler"},
-                    cookies={"session": "12345"},
-                ),
-            ]
+            ],
+            advertisements=3,
+            matches=3,
         )
 
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT count(*) FROM advertisements")
-        result = cursor.fetchone()
-        self.assertEqual(result[0], 3)
-        cursor.execute("SELECT * FROM keyword_advertisement")
-        result = cursor.fetchall()
-        self.assertEqual(len(result), 3)
-
 
-class TestMonsterHarvester(unittest.TestCase):
+class TestMonsterHarvester(HarvestTestCase):
 
     def setUp(self):
-        self.temp_db_file = tempfile.mkstemp(suffix=".db")[1]
-        self.connection = sqlite3.connect(self.temp_db_file)
-        # self.connection = sqlite3.connect(":memory:")
-        Harvester.create_schema(self.connection)
+        # harvest() is never reached, so the database does not need a file
+        self.connection = _connect_with_schema(":memory:")
 
     def tearDown(self):
         # Close the database connection after each test
         self.connection.close()
 
-    @patch("harvester.requests.get", side_effect=mocked_request_get)
-    def test_harwest(self, mock_requests_get):
-        config = {"url": "https://www.monster.de", "requests_per_minute": 60}
-        for keyword in KEYWORDS:
-            Harvester.insert_keyword(self.connection, keyword)
-        harvester = MonsterHarvester(config)
-        harvester._headers = {"User-Agent": MonsterHarvester.AGENT}
+    def test_harwest(self):
+        self._assert_not_implemented(MonsterHarvester, "https://www.monster.de")
 
-        # We need to explicitly call get_next_link which we know raises NotImplementedError
-        # instead of harvest which might be handling the exception now
-        with self.assertRaises(NotImplementedError) as context:
-            # Force evaluation of the generator
-            list(harvester.get_next_link())
 
-        self.assertEqual(
-            str(context.exception),
-            "MonsterHarvester.get_next_link() is not implemented yet.",
-        )
-
-        self.assertFalse(mock_requests_get.called)
-
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT count(*) FROM advertisements")
-        result = cursor.fetchone()
-        self.assertEqual(result[0], 0)
-        cursor.execute("SELECT * FROM keyword_advertisement")
-        result = cursor.fetchall()
-        self.assertEqual(len(result), 0)
-
-
-class TestIneedHarvester(unittest.TestCase):
+class TestIneedHarvester(HarvestTestCase):
 
     def setUp(self):
         # Set up an in-memory SQLite database for testing
-        self.temp_db_file = tempfile.NamedTemporaryFile(delete=False)
-        self.db_path = self.temp_db_file.name
-        self.temp_db_file.close()
-        self.connection = sqlite3.connect(self.db_path)
-        Harvester.create_schema(self.connection)
+        self.connection = _connect_with_schema(":memory:")
 
     def tearDown(self):
         # Close the database connection after each test
         self.connection.close()
-        os.unlink(self.db_path)
 
     def test_get_next_link(self):
         config = {"url": "https://www.monster.de", "requests_per_minute": 60}
@@ -526,42 +442,15 @@ class TestIneedHarvester(unittest.TestCase):
             "IndeedHarvester.get_next_link() is not implemented yet.",
         )
 
-    @patch("harvester.requests.get", side_effect=mocked_request_get)
-    def test_harwest(self, mock_requests_get):
-        config = {"url": "https://www.indeed.com", "requests_per_minute": 60}
-        for keyword in KEYWORDS:
-            Harvester.insert_keyword(self.connection, keyword)
-        harvester = IndeedHarvester(config)
-        harvester._headers = {"User-Agent": IndeedHarvester.AGENT}
-
-        # We need to explicitly call get_next_link which we know raises NotImplementedError
-        # instead of harvest which might be handling the exception now
-        with self.assertRaises(NotImplementedError) as context:
-            # Force evaluation of the generator
-            list(harvester.get_next_link())
-
-        self.assertEqual(
-            str(context.exception),
-            "IndeedHarvester.get_next_link() is not implemented yet.",
-        )
-
-        self.assertFalse(mock_requests_get.called)
-
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT count(*) FROM advertisements")
-        result = cursor.fetchone()
-        self.assertEqual(result[0], 0)
-        cursor.execute("SELECT * FROM keyword_advertisement")
-        result = cursor.fetchall()
-        self.assertEqual(len(result), 0)
+    def test_harwest(self):
+        self._assert_not_implemented(IndeedHarvester, "https://www.indeed.com")
 
 
 class TestInsertKeyword(unittest.TestCase):
 
     def setUp(self):
         # Set up an in-memory SQLite database for testing
-        self.connection = sqlite3.connect(":memory:")
-        Harvester.create_schema(self.connection)
+        self.connection = _connect_with_schema(":memory:")
 
     def tearDown(self):
         # Close the database connection after each test
@@ -599,8 +488,7 @@ class TestFetchKeywords(unittest.TestCase):
 
     def setUp(self):
         # Set up an in-memory SQLite database for testing
-        self.connection = sqlite3.connect(":memory:")
-        Harvester.create_schema(self.connection)
+        self.connection = _connect_with_schema(":memory:")
 
     def tearDown(self):
         # Close the database connection after each test
@@ -650,13 +538,10 @@ class TestHarvesterMethods(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test environment with a temporary database."""
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False)
-        self.db_path = self.temp_db.name
-        self.temp_db.close()
+        self.db_path = _temp_db_path()
 
         # Create connection and schema
-        self.connection = sqlite3.connect(self.db_path)
-        Harvester.create_schema(self.connection)
+        self.connection = _connect_with_schema(self.db_path)
 
         # Sample data for testing
         self.test_url = "https://example.com/job/12345"
@@ -665,7 +550,6 @@ class TestHarvesterMethods(unittest.TestCase):
     def tearDown(self) -> None:
         """Clean up test environment."""
         self.connection.close()
-        os.unlink(self.db_path)
 
     def test_advertisement_exists_with_updated_schema(self) -> None:
         """Test advertisement_exists method with updated schema."""
@@ -751,11 +635,12 @@ class TestHarvesterMethods(unittest.TestCase):
         self.connection.commit()
 
         # Patch the AdFactory.create method to return a mock advertisement
-        mock_ad = MagicMock()
-        mock_ad.get_title.return_value = "Test Job"
-        mock_ad.get_company.return_value = "Test Company"
-        mock_ad.get_location.return_value = "Test Location"
-        mock_ad.get_description.return_value = "Test Description"
+        mock_ad = SimpleNamespace(
+            get_title=lambda: "Test Job",
+            get_company=lambda: "Test Company",
+            get_location=lambda: "Test Location",
+            get_description=lambda: "Test Description",
+        )
 
         with patch("harvester.AdFactory.create", return_value=mock_ad):
             results = Harvester.fetch_advertisements_by_id_range(self.connection)
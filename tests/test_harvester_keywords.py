@@ -1,6 +1,5 @@
 import logging
 import sqlite3
-import tempfile
 import unittest
 import os
 import sys
@@ -12,7 +11,7 @@ sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 )
 from harvester import Harvester
-from keyword_manager import KeywordManager
+from keyword_manager import KeywordManager, LiteralMatcher
 from advert import Advertisement, StepstoneAdvertisement
 
 # Configure logging
@@ -79,23 +78,29 @@ Responsibilities include team management, client relations, and project oversigh
 class TestKeywordFunctionality(unittest.TestCase):
     """Characterization tests for the keyword functionality in the Harvester class."""
 
-    def setUp(self) -> None:
-        """Set up a temporary database for testing."""
-        self.temp_db = tempfile.NamedTemporaryFile(delete=False)
-        self.db_path = self.temp_db.name
-        self.temp_db.close()
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the shared harvester and compile SAMPLE_KEYWORDS once."""
+        # The keyword tests never fetch anything, so one harvester is enough
+        cls.harvester = Harvester({"url": "https://example.com"})
+
+        connection = sqlite3.connect(":memory:")
+        try:
+            Harvester.create_schema(connection)
+            KeywordManager().insert_keywords(connection, SAMPLE_KEYWORDS)
+            cls.sample_regexes = Harvester.fetch_keywords(connection)
+        finally:
+            connection.close()
 
+    def setUp(self) -> None:
+        """Set up an in-memory database for testing."""
         # Create connection and schema
-        self.connection = sqlite3.connect(self.db_path)
+        self.connection = sqlite3.connect(":memory:")
         Harvester.create_schema(self.connection)
 
-        # Create a basic harvester instance for testing
-        self.harvester = Harvester({"url": "https://example.com"})
-
     def tearDown(self) -> None:
-        """Clean up the temporary database."""
+        """Close the test database."""
         self.connection.close()
-        os.unlink(self.db_path)
 
     def test_insert_and_fetch_keywords(self) -> None:
         """Characterize the behavior of inserting and fetching keywords."""
@@ -127,6 +132,18 @@ class TestKeywordFunctionality(unittest.TestCase):
             else:
                 self.assertFalse(regexes[i].flags & re.IGNORECASE)
 
+    def test_insert_keywords_bulk(self) -> None:
+        """Test inserting several keywords at once, ignoring duplicates."""
+        keyword_manager = KeywordManager()
+        keyword_manager.insert_keywords(
+            self.connection, SAMPLE_KEYWORDS + SAMPLE_KEYWORDS[:2]
+        )
+
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT search FROM keywords ORDER BY id")
+        searches = [row[0] for row in cursor.fetchall()]
+        self.assertEqual(searches, [kw["search"] for kw in SAMPLE_KEYWORDS])
+
     def test_compile_keyword(self) -> None:
         """Characterize the _compile_keyword method behavior."""
         # Create a KeywordManager instance
@@ -153,14 +170,69 @@ class TestKeywordFunctionality(unittest.TestCase):
         self.assertEqual(pattern3.pattern, r"data\s+scien(ce|tist)")
         self.assertTrue(pattern3.flags & re.IGNORECASE)
 
+    def test_compile_literal_keyword(self) -> None:
+        """Test that literal keywords bypass the regex engine."""
+        keyword_manager = KeywordManager()
+
+        literal = keyword_manager._compile_keyword(
+            search="Python", case_sensitive=False
+        )
+        self.assertIsInstance(literal, LiteralMatcher)
+        self.assertTrue(literal.search("Senior PYTHON developer"))
+        self.assertFalse(literal.search("Senior Java developer"))
+
+        sensitive = keyword_manager._compile_keyword(search="SQL", case_sensitive=True)
+        self.assertIsInstance(sensitive, LiteralMatcher)
+        self.assertTrue(sensitive.search("SQL knowledge"))
+        self.assertFalse(sensitive.search("sql knowledge"))
+
+        # Patterns with regex metacharacters still compile to regexes
+        regex = keyword_manager._compile_keyword(
+            search=r"python\s+developer", case_sensitive=False
+        )
+        self.assertIsInstance(regex, re.Pattern)
+
+        # Case insensitive non-ASCII keywords stay on the regex engine
+        self.assertIsInstance(
+            keyword_manager._compile_keyword(search="İstanbul", case_sensitive=False),
+            re.Pattern,
+        )
+
+    def test_literal_keyword_agrees_with_regex(self) -> None:
+        """Test that case insensitive literals match exactly like re.IGNORECASE."""
+        cases = [
+            ("İstanbul", "Istanbul"),
+            ("İstanbul", "istanbul"),
+            ("σ", "ΟΔΟΣ"),
+            ("ς", "σ"),
+            ("istanbul", "Job in İstanbul"),
+            ("s", "ſ"),
+            ("straße", "STRASSE"),
+            ("python", "PYTHON Entwickler (m/w/d) für Köln"),
+        ]
+        for needle, text in cases:
+            expected = bool(re.search(re.escape(needle), text, re.IGNORECASE))
+            with self.subTest(needle=needle, text=text):
+                self.assertEqual(
+                    bool(KeywordManager._compile_keyword(needle, False).search(text)),
+                    expected,
+                )
+                self.assertEqual(LiteralMatcher(needle, False).search(text), expected)
+
+    def test_compile_keyword_cached(self) -> None:
+        """Test that compiling the same keyword twice reuses the matcher."""
+        first = KeywordManager._compile_keyword(r"\bjava\b", False)
+        second = KeywordManager._compile_keyword(r"\bjava\b", False)
+        self.assertIs(first, second)
+
+        # Case sensitivity is part of the cache key
+        sensitive = KeywordManager._compile_keyword(r"\bjava\b", True)
+        self.assertIsNot(first, sensitive)
+        self.assertEqual(sensitive.flags & re.IGNORECASE, 0)
+
     def test_match_keywords(self) -> None:
         """Characterize the match_keywords method behavior."""
-        # Insert test keywords
-        for keyword in SAMPLE_KEYWORDS:
-            Harvester.insert_keyword(self.connection, keyword)
-
-        # Fetch the keywords
-        regexes = Harvester.fetch_keywords(self.connection)
+        regexes = self.sample_regexes
 
         # Create a test advertisement that should match "Python Developer" and "JavaScript"
         python_ad = StepstoneAdvertisement(source=SAMPLE_HTML)
@@ -171,7 +243,7 @@ class TestKeywordFunctionality(unittest.TestCase):
         # Verify that the correct keywords matched
         # 1 = Python Developer, 4 = JavaScript
         expected_matches = [1, 4]
-        self.assertEqual(sorted(matched_keywords), sorted(expected_matches))
+        self.assertCountEqual(matched_keywords, expected_matches)
 
         # Test with a different advertisement that should match "Senior Position" and "Management"
         management_ad = StepstoneAdvertisement(source=MANAGEMENT_HTML)
@@ -182,7 +254,7 @@ class TestKeywordFunctionality(unittest.TestCase):
         # Verify that the correct keywords matched
         # 2 = Senior Position, 5 = Management
         expected_matches = [2, 5]
-        self.assertEqual(sorted(matched_keywords), sorted(expected_matches))
+        self.assertCountEqual(matched_keywords, expected_matches)
 
     def test_keyword_case_sensitivity(self) -> None:
         """Characterize the case sensitivity behavior of keyword matching."""
@@ -193,8 +265,7 @@ class TestKeywordFunctionality(unittest.TestCase):
         ]
 
         # Insert test keywords
-        for keyword in case_test_keywords:
-            Harvester.insert_keyword(self.connection, keyword)
+        KeywordManager().insert_keywords(self.connection, case_test_keywords)
 
         # Fetch the keywords
         regexes = Harvester.fetch_keywords(self.connection)
@@ -229,7 +300,7 @@ class TestKeywordFunctionality(unittest.TestCase):
         # Should match both keywords (id 1 and 2)
         # ID 1: JavaScript (case sensitive) should match "JavaScript"
         # ID 2: javascript (case insensitive) should match "JavaScript"
-        self.assertEqual(sorted(mixed_case_matches), [1, 2])
+        self.assertCountEqual(mixed_case_matches, [1, 2])
 
         # Match keywords for lowercase ad
         lower_case_matches = self.harvester.match_keywords(lower_case_ad, regexes)
@@ -237,7 +308,7 @@ class TestKeywordFunctionality(unittest.TestCase):
         # Should only match keyword (id 2)
         # ID 1: JavaScript (case sensitive) should NOT match "javascript"
         # ID 2: javascript (case insensitive) should match "javascript"
-        self.assertEqual(sorted(lower_case_matches), [2])
+        self.assertCountEqual(lower_case_matches, [2])
 
     def test_empty_and_edge_cases(self) -> None:
         """Characterize behavior with empty or edge case inputs."""
@@ -246,8 +317,7 @@ class TestKeywordFunctionality(unittest.TestCase):
         self.assertEqual(empty_regexes, {})
 
         # Insert keywords then test with empty ad
-        for keyword in SAMPLE_KEYWORDS:
-            Harvester.insert_keyword(self.connection, keyword)
+        KeywordManager().insert_keywords(self.connection, SAMPLE_KEYWORDS)
 
         regexes = Harvester.fetch_keywords(self.connection)
 
@@ -323,8 +393,7 @@ class TestKeywordFunctionality(unittest.TestCase):
         ]
 
         # Insert patterns
-        for pattern in patterns:
-            Harvester.insert_keyword(self.connection, pattern)
+        KeywordManager().insert_keywords(self.connection, patterns)
 
         # Fetch patterns
         regexes = Harvester.fetch_keywords(self.connection)
@@ -354,8 +423,10 @@ class TestKeywordFunctionality(unittest.TestCase):
         # - "Complex Pattern" should match "5 years experience"
 
         # All patterns should match something in our test HTML
+        for keyword_id, pattern in enumerate(patterns, 1):
+            with self.subTest(pattern=pattern["search"]):
+                self.assertIn(keyword_id, matched_patterns)
         self.assertEqual(len(matched_patterns), len(patterns))
-        self.assertEqual(set(matched_patterns), set(range(1, len(patterns) + 1)))
 
     def test_title_only_matching(self) -> None:
         """Test that the title_only parameter properly controls which content is matched against."""
@@ -404,17 +475,22 @@ class TestKeywordFunctionality(unittest.TestCase):
         self.assertEqual(len(regexes), 1, "Should have exactly one keyword")
 
         # Create test advertisements
-        title_ad = Advertisement(source=html_with_keyword_in_title_only)
-        title_ad.get_title = lambda: "Senior Python Developer"
-        title_ad.get_description = (
-            lambda: "We are looking for a skilled developer with experience."
-        )
+        class TitleAd(Advertisement):
+            def get_title(self):
+                return "Senior Python Developer"
 
-        description_ad = Advertisement(source=html_with_keyword_in_description_only)
-        description_ad.get_title = lambda: "Software Developer Position"
-        description_ad.get_description = (
-            lambda: "We are looking for a skilled Python Developer with experience."
-        )
+            def get_description(self):
+                return "We are looking for a skilled developer with experience."
+
+        class DescriptionAd(Advertisement):
+            def get_title(self):
+                return "Software Developer Position"
+
+            def get_description(self):
+                return "We are looking for a skilled Python Developer with experience."
+
+        title_ad = TitleAd(source=html_with_keyword_in_title_only)
+        description_ad = DescriptionAd(source=html_with_keyword_in_description_only)
 
         # Test 1: Using title_only=True
         # Should match when the keyword is in the title, but not when it's only in description
@@ -472,6 +548,32 @@ class TestKeywordFunctionality(unittest.TestCase):
             "Harvester should match keyword in description",
         )
 
+    def test_build_matcher(self) -> None:
+        """Test the matcher built for a fixed keyword set."""
+        keyword_manager = KeywordManager(logger)
+        regexes = {
+            3: keyword_manager._compile_keyword(r"python\s+developer", False),
+            7: keyword_manager._compile_keyword("SQL", True),
+        }
+
+        matcher = keyword_manager.build_matcher(regexes)
+
+        self.assertEqual(matcher("Python  Developer with SQL"), [3, 7])
+        self.assertEqual(matcher("python developer with sql"), [3])
+        self.assertEqual(matcher("Java Developer"), [])
+
+    def test_match_keywords_after_in_place_change(self) -> None:
+        """Test that replacing a keyword in place is picked up by matching."""
+        keyword_manager = KeywordManager(logger)
+        regexes = {1: keyword_manager._compile_keyword("python", False)}
+        ad = Advertisement(source="<html></html>")
+        ad.get_title = lambda: "Java Developer"
+
+        self.assertEqual(keyword_manager.match_keywords(ad, regexes), [])
+
+        regexes[1] = keyword_manager._compile_keyword("java", False)
+        self.assertEqual(keyword_manager.match_keywords(ad, regexes), [1])
+
     def test_title_only_with_missing_fields(self) -> None:
         """Test title_only parameter with advertisements that have missing title or description."""
         # Create keyword manager for direct testing